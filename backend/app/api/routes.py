@@ -2254,6 +2254,61 @@ async def light_scan(request: LightScanRequest) -> LightScanResponse:
         )
 
 
+@router.post(
+    "/light-scan/stream",
+    summary="Light Scan (Streaming) - Google Dorking Profile Discovery",
+    description="""
+    Streaming variant of the light scan returning newline-delimited JSON.
+    
+    Records are emitted as they become available:
+    1. `meta` - scan ID, identifier and applied location
+    2. `platform` - one record per platform as its searches complete
+    3. `summary` - result counts, duration and deep scan availability
+    """
+)
+async def light_scan_stream(request: LightScanRequest) -> StreamingResponse:
+    """
+    Perform light scan using Google Dorking, streaming results as NDJSON.
+    
+    Args:
+        request: LightScanRequest containing identifier_type, identifier_value, and optional location
+    
+    Returns:
+        StreamingResponse: application/x-ndjson stream of scan events
+    
+    Raises:
+        HTTPException: 400 if identifier type is invalid
+    """
+    import json
+    
+    events = light_scan_service.scan_stream(
+        identifier_type=request.identifier_type,
+        identifier_value=request.identifier_value,
+        location=request.location
+    )
+    
+    # Pull the first event eagerly so validation errors become a 400
+    # instead of failing after the response has started
+    try:
+        first_event = await events.__anext__()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    async def ndjson_lines():
+        yield json.dumps(first_event, ensure_ascii=False) + "\n"
+        try:
+            async for event in events:
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+        except Exception as e:
+            logger.error(f"Error in light_scan_stream endpoint: {str(e)}")
+            yield json.dumps({"event": "error", "detail": str(e)}) + "\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/scan-options",
     response_model=ScanOptionsResponse,
@@ -61,7 +61,7 @@ async def lifespan(app: FastAPI):
     - Preload the spaCy NLP model to avoid cold start delays
     
     Shutdown:
-    - Clean up any resources if needed
+    - Close pooled HTTP clients
     
     Args:
         app: FastAPI application instance
@@ -100,8 +100,12 @@ async def lifespan(app: FastAPI):
     
     yield  # Application is running
     
-    # Shutdown: Cleanup (if needed)
+    # Shutdown: Cleanup
     logger.info("👋 Shutting down Digital Footprint Analyzer...")
+    
+    # Close the pooled HTTP client shared by profile data collectors
+    from app.services.social.data_collector import aclose_default
+    await aclose_default()
 
 
 # =============================================================================
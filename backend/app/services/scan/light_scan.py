@@ -24,9 +24,10 @@ NO phone number support in Light Scan (as per requirements).
 Note on Google Search Usage:
     This service uses Google Search to perform dork queries. Rate limiting
     is implemented (3 seconds between requests) to reduce the risk of being
-    blocked. For production use, consider:
-    - Using Google's Custom Search JSON API for proper authentication
-    - Implementing exponential backoff for rate limiting
+    blocked, and transient 429/503 responses are retried with exponential
+    backoff. For production use, consider:
+    - Setting GOOGLE_API_KEY and GOOGLE_CSE_ID to use Google's Custom
+      Search JSON API instead of HTML scraping
     - Using multiple IP addresses/proxies for higher volume
 
 Example Usage:
@@ -39,19 +40,126 @@ Example Usage:
 """
 
 import asyncio
+import copy
+import functools
 import logging
+import random
 import re
 import time
 import uuid
-from typing import Dict, List, Optional, Any, Set
-from urllib.parse import quote_plus, urlparse, parse_qs
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, AsyncIterator, Set, Tuple
+from urllib.parse import unquote_plus, urlparse
 
 import httpx
 from bs4 import BeautifulSoup
 
+try:
+    import brotli  # noqa: F401 - enables httpx Brotli decoding
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+from app.core.config import settings
+
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Translation table deleting dots and underscores in a single C-level pass
+_STRIP_DOTS_UNDERSCORES = str.maketrans('', '', '._')
+
+# Matches any character that is not a lowercase letter or digit
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
+
+def _decode_google_redirect(href: str) -> str:
+    """
+    Extract the target URL from a Google "/url?q=<target>&..." redirect.
+    
+    Reads only the "q" parameter with string partitioning rather than
+    building a full parse_qs dict for every link.
+    
+    Args:
+        href: Link href, either a redirect or a direct URL
+    
+    Returns:
+        str: Decoded target URL, the href unchanged if it is not a
+        redirect, or "" if the redirect has no "q" parameter
+    """
+    _, marker, query = href.partition("/url?")
+    if not marker:
+        return href
+    
+    if query.startswith("q="):
+        value = query[2:]
+    else:
+        _, found, value = query.partition("&q=")
+        if not found:
+            return ""
+    
+    return unquote_plus(value.partition("&")[0])
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+@dataclass
+class PlatformHits:
+    """
+    Deduplicated search hits for one platform, stored column-wise.
+    
+    Parallel lists avoid holding a dict per hit while a scan is running;
+    result dicts are only built by to_results() at the response boundary.
+    
+    Attributes:
+        urls: Profile URLs in discovery order
+        titles: Search result titles
+        snippets: Search result snippets (may be None)
+        queries: Dork query that first found each URL
+        failed_queries: Number of queries whose search failed (throttled,
+            non-200 or transport error) rather than finding nothing
+    """
+    urls: List[str] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    snippets: List[Optional[str]] = field(default_factory=list)
+    queries: List[str] = field(default_factory=list)
+    failed_queries: int = 0
+    _seen: Set[str] = field(default_factory=set, init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        # Hits passed to the constructor count as already seen
+        self._seen.update(self.urls)
+    
+    def add(self, url: str, title: str, snippet: Optional[str], query: str) -> bool:
+        """Append a hit unless its URL was already seen; returns True if added."""
+        if url in self._seen:
+            return False
+        self._seen.add(url)
+        self.urls.append(url)
+        self.titles.append(title)
+        self.snippets.append(snippet)
+        self.queries.append(query)
+        return True
+    
+    def __len__(self) -> int:
+        return len(self.urls)
+    
+    def to_results(self) -> List[Dict[str, Any]]:
+        """Materialize hits as result dicts for the API response."""
+        return [
+            {
+                "title": title,
+                "url": url,
+                "snippet": snippet,
+                "query_used": query
+            }
+            for url, title, snippet, query in zip(
+                self.urls, self.titles, self.snippets, self.queries
+            )
+        ]
+
 
 class LightScanService:
     """
@@ -108,6 +216,10 @@ class LightScanService:
     # Google search URL template
     GOOGLE_SEARCH_URL = "https://www.google.com/search"
     
+    # Google Custom Search JSON API (used instead of HTML scraping when an
+    # API key and search engine ID are configured)
+    GOOGLE_CSE_URL = "https://www.googleapis.com/customsearch/v1"
+    
     # Request configuration
     DEFAULT_HEADERS = {
         "User-Agent": (
@@ -115,9 +227,10 @@ class LightScanService:
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/131.0.0.0 Safari/537.36"
         ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept": "text/html",
         "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate",
+        # Only advertise Brotli when httpx can decode it
+        "Accept-Encoding": "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate",
         "Connection": "keep-alive",
     }
     REQUEST_TIMEOUT = 15.0
@@ -126,14 +239,77 @@ class LightScanService:
     # Using 3 seconds between requests to reduce risk of being rate limited
     DELAY_BETWEEN_REQUESTS = 3.0  # seconds
     
-    def __init__(self):
-        """Initialize the Light Scan Service."""
+    # Retry configuration for transient Google failures (429/503 and
+    # transport errors); backoff doubles per attempt with random jitter
+    MAX_RETRIES = 3
+    RETRY_STATUS_CODES = frozenset([429, 503])
+    RETRY_BASE_DELAY = 1.0  # seconds
+    
+    # Recent scan results are reused for identical requests
+    SCAN_CACHE_TTL_SECONDS = 600  # 10 minutes
+    SCAN_CACHE_MAX_SIZE = 256
+    
+    # Registrable domains per platform
+    PLATFORM_DOMAINS = {
+        "facebook": ("facebook.com",),
+        "instagram": ("instagram.com",),
+        "linkedin": ("linkedin.com",),
+        "x": ("x.com", "twitter.com"),
+    }
+    
+    # Exact hostnames accepted per platform (bare domain or "www."), checked
+    # by equality rather than suffix so look-alike domains such as
+    # "fakex.com" or "evil.x.com" are rejected
+    VALID_HOSTS = {
+        platform_id: frozenset(
+            host for domain in domains for host in (domain, f"www.{domain}")
+        )
+        for platform_id, domains in PLATFORM_DOMAINS.items()
+    }
+    
+    def __init__(
+        self,
+        cse_api_key: Optional[str] = None,
+        cse_id: Optional[str] = None
+    ):
+        """
+        Initialize the Light Scan Service.
+        
+        Args:
+            cse_api_key: Google API key (uses config if not provided)
+            cse_id: Custom Search Engine ID (uses config if not provided)
+        """
+        self._cse_key = cse_api_key or settings.GOOGLE_API_KEY
+        self._cse_cx = cse_id or settings.GOOGLE_CSE_ID
+        
+        # Exclude paths that are a single path segment (e.g. "/login",
+        # "/p/") become a hashed set lookup; anything spanning several
+        # segments falls back to a compiled regex
+        self._excluded_segments: Dict[str, frozenset] = {}
         self._compiled_exclude_patterns: Dict[str, List[re.Pattern]] = {}
         for platform_id, config in self.PLATFORMS.items():
-            self._compiled_exclude_patterns[platform_id] = [
-                re.compile(pattern, re.IGNORECASE)
-                for pattern in config["exclude_paths"]
-            ]
+            segments = set()
+            multi_segment = []
+            for pattern in config["exclude_paths"]:
+                segment = pattern.strip("/").lower()
+                if "/" in segment:
+                    multi_segment.append(re.compile(pattern, re.IGNORECASE))
+                else:
+                    segments.add(segment)
+            self._excluded_segments[platform_id] = frozenset(segments)
+            self._compiled_exclude_patterns[platform_id] = multi_segment
+        
+        # Rate limiter state (lock is created lazily inside a running loop)
+        self._rate_limit_lock: Optional[asyncio.Lock] = None
+        self._next_request_at = 0.0
+        
+        # Scan result cache: key -> (timestamp, result), least recently
+        # used first; per-key locks stop concurrent identical scans from
+        # all missing the cache at once. A lock is dropped only once no
+        # task holds or waits on it
+        self._scan_cache: OrderedDict = OrderedDict()
+        self._scan_locks: Dict[Tuple[str, str, str], asyncio.Lock] = {}
+        self._scan_lock_users: Dict[Tuple[str, str, str], int] = {}
     
     # -------------------------------------------------------------------------
     # PUBLIC SCAN METHOD
@@ -148,6 +324,10 @@ class LightScanService:
         """
         Perform a light scan using Google Dorking.
         
+        Results are cached for SCAN_CACHE_TTL_SECONDS keyed by identifier
+        type, value and location (case-insensitive); a cache hit returns a
+        copy with a fresh scan_id.
+        
         Args:
             identifier_type: Type of identifier ('name', 'email', 'username')
             identifier_value: The identifier value to search for
@@ -168,6 +348,159 @@ class LightScanService:
                 - deep_scan_available: bool
                 - deep_scan_message: str
         
+        Raises:
+            ValueError: If identifier_type is not supported
+        """
+        start_time = time.time()
+        key = (
+            identifier_type,
+            identifier_value.strip().lower(),
+            (location or self.DEFAULT_LOCATION).lower()
+        )
+        
+        cached = self._get_cached_scan(key)
+        if cached is None:
+            lock = self._scan_locks.setdefault(key, asyncio.Lock())
+            self._scan_lock_users[key] = self._scan_lock_users.get(key, 0) + 1
+            try:
+                async with lock:
+                    cached = self._get_cached_scan(key)
+                    if cached is None:
+                        result = await self._collect_scan(
+                            identifier_type, identifier_value, location
+                        )
+                        # A throttled or failed search is not a real "no
+                        # results"; leave it uncached so a retry searches again
+                        if not any(
+                            platform["failed_queries"]
+                            for platform in result["platforms"]
+                        ):
+                            self._store_cached_scan(key, result)
+                        return copy.deepcopy(result)
+            finally:
+                users = self._scan_lock_users[key] - 1
+                if users:
+                    self._scan_lock_users[key] = users
+                else:
+                    del self._scan_lock_users[key]
+                    del self._scan_locks[key]
+        
+        # The cache key is case-insensitive; echo this request's own
+        # identifier and location rather than the first caller's
+        cached["identifier"] = {
+            "type": identifier_type,
+            "value": identifier_value.strip()
+        }
+        cached["location"] = location or self.DEFAULT_LOCATION
+        cached["scan_id"] = f"LS-{uuid.uuid4().hex[:8].upper()}"
+        cached["scan_duration_seconds"] = round(time.time() - start_time, 2)
+        return cached
+    
+    def _get_cached_scan(
+        self,
+        key: Tuple[str, str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get a copy of a cached scan result if present and not expired."""
+        entry = self._scan_cache.get(key)
+        if entry is None:
+            return None
+        
+        timestamp, result = entry
+        if time.time() - timestamp > self.SCAN_CACHE_TTL_SECONDS:
+            del self._scan_cache[key]
+            return None
+        
+        self._scan_cache.move_to_end(key)
+        return copy.deepcopy(result)
+    
+    def _store_cached_scan(
+        self,
+        key: Tuple[str, str, str],
+        result: Dict[str, Any]
+    ) -> None:
+        """Store a scan result, evicting the least recently used entries."""
+        self._scan_cache[key] = (time.time(), copy.deepcopy(result))
+        self._scan_cache.move_to_end(key)
+        while len(self._scan_cache) > self.SCAN_CACHE_MAX_SIZE:
+            self._scan_cache.popitem(last=False)
+    
+    async def _collect_scan(
+        self,
+        identifier_type: str,
+        identifier_value: str,
+        location: Optional[str]
+    ) -> Dict[str, Any]:
+        """Run a scan by accumulating scan_stream() events into one dict."""
+        response: Dict[str, Any] = {}
+        platforms_by_id: Dict[str, Dict[str, Any]] = {}
+        
+        async for event in self.scan_stream(
+            identifier_type, identifier_value, location
+        ):
+            event_type = event.pop("event")
+            if event_type == "platform":
+                platforms_by_id[event["platform"]] = event
+            else:
+                response.update(event)
+        
+        # Report platforms in configuration order regardless of which
+        # finished first
+        platforms = [
+            platforms_by_id[platform_id]
+            for platform_id in self.PLATFORMS
+            if platform_id in platforms_by_id
+        ]
+        all_urls = [
+            {
+                "platform": platform_data["platform"],
+                "url": result["url"],
+                "title": result["title"]
+            }
+            for platform_data in platforms
+            for result in platform_data["results"]
+        ]
+        
+        return {
+            "success": True,
+            "scan_type": response["scan_type"],
+            "scan_id": response["scan_id"],
+            "identifier": response["identifier"],
+            "location": response["location"],
+            "scan_duration_seconds": response["scan_duration_seconds"],
+            "total_results": response["total_results"],
+            "platforms": platforms,
+            "summary": response["summary"],
+            "all_urls": all_urls,
+            "deep_scan_available": response["deep_scan_available"],
+            "deep_scan_message": response["deep_scan_message"]
+        }
+    
+    async def scan_stream(
+        self,
+        identifier_type: str,
+        identifier_value: str,
+        location: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Perform a light scan, yielding results as each platform completes.
+        
+        Input is validated before the first event is produced, so callers
+        can surface a ValueError before starting a streaming response.
+        
+        Args:
+            identifier_type: Type of identifier ('name', 'email', 'username')
+            identifier_value: The identifier value to search for
+            location: Optional location filter (default: Sri Lanka)
+        
+        Yields:
+            Event dicts, each with an "event" key:
+                - "meta": scan_type, scan_id, identifier, location
+                - "platform": platform, platform_emoji, results_count,
+                  results, queries_used, failed_queries (one per platform,
+                  in completion order)
+                - "summary": scan_duration_seconds, total_results, summary,
+                  deep_scan_available, deep_scan_message
+        
         Raises:
             ValueError: If identifier_type is not supported
         """
@@ -192,67 +525,67 @@ class LightScanService:
         # Generate scan ID
         scan_id = f"LS-{uuid.uuid4().hex[:8].upper()}"
         
+        yield {
+            "event": "meta",
+            "scan_type": "light",
+            "scan_id": scan_id,
+            "identifier": {
+                "type": identifier_type,
+                "value": identifier_value
+            },
+            "location": location
+        }
+        
         # Generate dork queries based on identifier type
         queries_by_platform = self._generate_queries(
             identifier_type, identifier_value, location
         )
         
-        # Execute searches and collect results
-        platform_results = await self._execute_searches(queries_by_platform)
-        
-        # Build response
-        platforms = []
-        all_urls = []
         summary = {}
         total_results = 0
         
-        for platform_id, results in platform_results.items():
-            config = self.PLATFORMS[platform_id]
-            
-            # Deduplicate results by URL
-            seen_urls: Set[str] = set()
-            unique_results = []
-            for result in results:
-                if result["url"] not in seen_urls:
-                    seen_urls.add(result["url"])
-                    unique_results.append(result)
-            
-            platform_data = {
-                "platform": platform_id,
-                "platform_emoji": config["emoji"],
-                "results_count": len(unique_results),
-                "results": unique_results,
-                "queries_used": queries_by_platform[platform_id]
-            }
-            platforms.append(platform_data)
-            
-            summary[platform_id] = len(unique_results)
-            total_results += len(unique_results)
-            
-            # Add to all_urls
-            for result in unique_results:
-                all_urls.append({
-                    "platform": platform_id,
-                    "url": result["url"],
-                    "title": result["title"]
-                })
-        
-        scan_duration = time.time() - start_time
+        async with httpx.AsyncClient(
+            headers=self.DEFAULT_HEADERS,
+            timeout=self.REQUEST_TIMEOUT,
+            follow_redirects=True
+        ) as client:
+            tasks = [
+                asyncio.ensure_future(
+                    self._search_platform(client, platform_id, queries)
+                )
+                for platform_id, queries in queries_by_platform.items()
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    platform_id, hits = await next_done
+                    
+                    # Hits are already deduplicated by URL during collection
+                    unique_results = hits.to_results()
+                    summary[platform_id] = len(unique_results)
+                    total_results += len(unique_results)
+                    
+                    yield {
+                        "event": "platform",
+                        "platform": platform_id,
+                        "platform_emoji": self.PLATFORMS[platform_id]["emoji"],
+                        "results_count": len(unique_results),
+                        "results": unique_results,
+                        "queries_used": queries_by_platform[platform_id],
+                        "failed_queries": hits.failed_queries
+                    }
+            finally:
+                # Client disconnected or consumer stopped early: wait for
+                # the cancelled searches to unwind (releasing the rate
+                # limit lock and open requests) before the client closes
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
         
-        return {
-            "success": True,
-            "scan_type": "light",
-            "scan_id": scan_id,
-            "identifier": {
-                "type": identifier_type,
-                "value": identifier_value
-            },
-            "location": location,
-            "scan_duration_seconds": round(scan_duration, 2),
+        yield {
+            "event": "summary",
+            "scan_duration_seconds": round(time.time() - start_time, 2),
             "total_results": total_results,
-            "platforms": platforms,
             "summary": summary,
-            "all_urls": all_urls,
             "deep_scan_available": True,
             "deep_scan_message": (
                 "Want more detailed analysis? "
@@ -305,7 +638,10 @@ class LightScanService:
                     dork_base, identifier_value
                 ))
             
-            queries_by_platform[platform_id] = queries
+            # Drop duplicate queries (e.g. variations that collapse to the
+            # same string) while preserving order - each one costs a full
+            # rate-limited Google round-trip
+            queries_by_platform[platform_id] = list(dict.fromkeys(queries))
         
         return queries_by_platform
     
@@ -344,7 +680,7 @@ class LightScanService:
             queries.append(f'{dork_base} "{username}"')
             
             # Remove dots and underscores for variation
-            clean_username = re.sub(r'[._]', '', username)
+            clean_username = username.translate(_STRIP_DOTS_UNDERSCORES)
             if clean_username != username:
                 queries.append(f'{dork_base} "{clean_username}"')
         
@@ -372,15 +708,20 @@ class LightScanService:
         
         return queries
     
-    def _generate_username_variations(self, username: str) -> List[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _generate_username_variations(username: str) -> Tuple[str, ...]:
         """
         Generate common username variations.
         
+        Results are memoized per username; a tuple is returned so the
+        cached value cannot be mutated by callers.
+        
         Args:
             username: Base username
         
         Returns:
-            List of username variations (including original)
+            Tuple of username variations (including original)
         """
         username = username.lower()
         variations = set()
@@ -388,87 +729,85 @@ class LightScanService:
         # Original
         variations.add(username)
         
-        # Remove underscores
-        variations.add(username.replace('_', ''))
-        
-        # Remove dots
-        variations.add(username.replace('.', ''))
-        
-        # Replace underscores with dots
-        variations.add(username.replace('_', '.'))
+        # Each transform is skipped when it would return the username
+        # unchanged, avoiding a throwaway string copy
+        if '_' in username:
+            # Remove underscores / replace them with dots
+            variations.add(username.replace('_', ''))
+            variations.add(username.replace('_', '.'))
         
-        # Replace dots with underscores
-        variations.add(username.replace('.', '_'))
+        if '.' in username:
+            # Remove dots / replace them with underscores
+            variations.add(username.replace('.', ''))
+            variations.add(username.replace('.', '_'))
         
-        # Remove all special characters
-        clean = re.sub(r'[^a-z0-9]', '', username)
-        variations.add(clean)
+        # Remove all special characters (already clean if ASCII alphanumeric)
+        if not (username.isascii() and username.isalnum()):
+            variations.add(_NON_ALNUM_RE.sub('', username))
         
         # Filter out empty strings
         variations.discard('')
         
-        return list(variations)
+        return tuple(variations)
     
     # -------------------------------------------------------------------------
     # SEARCH EXECUTION METHODS
     # -------------------------------------------------------------------------
     
-    async def _execute_searches(
+    async def _search_platform(
         self,
-        queries_by_platform: Dict[str, List[str]]
-    ) -> Dict[str, List[Dict[str, Any]]]:
+        client: httpx.AsyncClient,
+        platform_id: str,
+        queries: List[str]
+    ) -> Tuple[str, PlatformHits]:
         """
-        Execute Google searches for all queries.
+        Execute all Google searches for one platform.
+        
+        Results are deduplicated by URL as they arrive; the first query
+        that found a URL is recorded as its query_used.
         
         Args:
-            queries_by_platform: Dict mapping platform_id to list of queries
+            client: httpx AsyncClient
+            platform_id: Platform identifier
+            queries: Dork queries for the platform
         
         Returns:
-            Dict mapping platform_id to list of results
+            Tuple of (platform_id, PlatformHits)
         """
-        results_by_platform: Dict[str, List[Dict[str, Any]]] = {}
+        hits = PlatformHits()
         
-        async with httpx.AsyncClient(
-            headers=self.DEFAULT_HEADERS,
-            timeout=self.REQUEST_TIMEOUT,
-            follow_redirects=True
-        ) as client:
-            for platform_id, queries in queries_by_platform.items():
-                platform_results = []
+        for query in queries:
+            try:
+                # Execute search
+                search_results = await self._execute_single_search(
+                    client, query, platform_id
+                )
+                if search_results is None:
+                    hits.failed_queries += 1
+                    continue
                 
-                for query in queries:
-                    try:
-                        # Execute search
-                        search_results = await self._execute_single_search(
-                            client, query, platform_id
-                        )
-                        
-                        # Tag results with the query used
-                        for result in search_results:
-                            result["query_used"] = query
-                        
-                        platform_results.extend(search_results)
-                        
-                        # Rate limiting delay
-                        await asyncio.sleep(self.DELAY_BETWEEN_REQUESTS)
-                        
-                    except Exception as e:
-                        logger.warning(
-                            f"Search failed for platform {platform_id}, "
-                            f"query '{query}': {str(e)}"
-                        )
-                        continue
+                for result in search_results:
+                    hits.add(
+                        result["url"], result["title"],
+                        result.get("snippet"), query
+                    )
                 
-                results_by_platform[platform_id] = platform_results
+            except Exception as e:
+                logger.warning(
+                    f"Search failed for platform {platform_id}, "
+                    f"query '{query}': {str(e)}"
+                )
+                hits.failed_queries += 1
+                continue
         
-        return results_by_platform
+        return platform_id, hits
     
     async def _execute_single_search(
         self,
         client: httpx.AsyncClient,
         query: str,
         platform_id: str
-    ) -> List[Dict[str, Any]]:
+    ) -> Optional[List[Dict[str, Any]]]:
         """
         Execute a single Google search and parse results.
         
@@ -478,27 +817,32 @@ class LightScanService:
             platform_id: Platform identifier for filtering
         
         Returns:
-            List of result dictionaries with title, url, snippet
+            List of result dictionaries with title, url, snippet, or None
+            if the search failed (final non-200 status or request error)
         """
         results = []
         
         try:
+            # Prefer the Custom Search JSON API when configured - it returns
+            # small JSON payloads and is quota-based rather than bot-detected
+            if self.is_cse_configured():
+                return await self._execute_cse_search(client, query, platform_id)
+            
             # Build search URL
             params = {
                 "q": query,
                 "num": 10,  # Number of results
             }
             
-            response = await client.get(
-                self.GOOGLE_SEARCH_URL,
-                params=params
+            response = await self._get_with_retry(
+                client, self.GOOGLE_SEARCH_URL, params
             )
             
             if response.status_code != 200:
                 logger.warning(
                     f"Google search returned status {response.status_code}"
                 )
-                return results
+                return None
             
             # Parse HTML response using lxml parser (included in requirements.txt)
             # lxml is faster and more robust than html.parser
@@ -516,11 +860,128 @@ class LightScanService:
         
         except httpx.HTTPError as e:
             logger.warning(f"HTTP error during search: {str(e)}")
+            return None
         except Exception as e:
             logger.warning(f"Error parsing search results: {str(e)}")
+            return None
         
         return results
     
+    async def _execute_cse_search(
+        self,
+        client: httpx.AsyncClient,
+        query: str,
+        platform_id: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Execute a single query against the Google Custom Search JSON API.
+        
+        Args:
+            client: httpx AsyncClient
+            query: Google dork query
+            platform_id: Platform identifier for filtering
+        
+        Returns:
+            List of result dictionaries with title, url, snippet, or None
+            if the API returned a non-200 status
+        """
+        params = {
+            "key": self._cse_key,
+            "cx": self._cse_cx,
+            "q": query,
+            "num": 10,
+        }
+        
+        response = await self._get_with_retry(
+            client, self.GOOGLE_CSE_URL, params,
+            rate_limited=False, headers={"Accept": "application/json"}
+        )
+        
+        if response.status_code != 200:
+            logger.warning(
+                f"Custom Search API returned status {response.status_code}"
+            )
+            return None
+        
+        return [
+            {
+                "title": item.get("title", ""),
+                "url": item["link"],
+                "snippet": item.get("snippet"),
+            }
+            for item in response.json().get("items", [])
+            if item.get("link")
+            and self._is_valid_profile_url(item["link"], platform_id)
+        ]
+    
+    async def _acquire_request_slot(self) -> None:
+        """
+        Wait until the next Google request is allowed to start.
+        
+        Requests are spaced DELAY_BETWEEN_REQUESTS apart measured from the
+        start of the previous request, so time spent waiting on a slow
+        response counts towards the delay and nothing sleeps after the
+        final query.
+        """
+        if self._rate_limit_lock is None:
+            self._rate_limit_lock = asyncio.Lock()
+        
+        async with self._rate_limit_lock:
+            wait = self._next_request_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_request_at = time.monotonic() + self.DELAY_BETWEEN_REQUESTS
+    
+    async def _get_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: Dict[str, Any],
+        rate_limited: bool = True,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Issue a rate-limited GET, retrying transient failures.
+        
+        Responses with a status in RETRY_STATUS_CODES and httpx transport
+        errors are retried up to MAX_RETRIES attempts with exponential
+        backoff and jitter. The last response is returned (or the last
+        transport error re-raised) once attempts are exhausted.
+        
+        Args:
+            client: httpx AsyncClient
+            url: Request URL
+            params: Query string parameters
+            rate_limited: Wait for the request pacing slot before each attempt
+            headers: Extra request headers overriding the client defaults
+        
+        Returns:
+            httpx.Response: The final response
+        """
+        for attempt in range(self.MAX_RETRIES):
+            if rate_limited:
+                await self._acquire_request_slot()
+            try:
+                response = await client.get(url, params=params, headers=headers)
+            except httpx.TransportError as e:
+                if attempt == self.MAX_RETRIES - 1:
+                    raise
+                logger.debug(f"Transport error on attempt {attempt + 1}: {e}")
+            else:
+                if (response.status_code not in self.RETRY_STATUS_CODES
+                        or attempt == self.MAX_RETRIES - 1):
+                    return response
+                logger.debug(
+                    f"Google returned {response.status_code} "
+                    f"on attempt {attempt + 1}, retrying"
+                )
+            
+            delay = self.RETRY_BASE_DELAY * (2 ** attempt)
+            await asyncio.sleep(delay * random.uniform(0.75, 1.25))
+        
+        # Unreachable: the final attempt always returns or raises
+        raise RuntimeError("retry loop exited without a response")
+    
     def _extract_search_results(
         self,
         soup: BeautifulSoup
@@ -551,9 +1012,7 @@ class LightScanService:
                 
                 # Skip Google redirect URLs
                 if url.startswith("/url?"):
-                    parsed = urlparse(url)
-                    params = parse_qs(parsed.query)
-                    url = params.get("q", [""])[0]
+                    url = _decode_google_redirect(url)
                 
                 # Skip empty or Google internal URLs
                 if not url or url.startswith("/"):
@@ -583,9 +1042,7 @@ class LightScanService:
                 
                 # Check if this looks like a search result
                 if "/url?" in href:
-                    parsed = urlparse(href)
-                    params = parse_qs(parsed.query)
-                    url = params.get("q", [""])[0]
+                    url = _decode_google_redirect(href)
                     
                     if url and not url.startswith("/"):
                         title = link.get_text(strip=True)
@@ -612,41 +1069,33 @@ class LightScanService:
         if not url or platform_id not in self.PLATFORMS:
             return False
         
-        config = self.PLATFORMS[platform_id]
-        
         # Parse the URL to extract the hostname
         try:
             parsed = urlparse(url)
-            hostname = parsed.hostname or ""
-            hostname_lower = hostname.lower()
-            path = parsed.path.strip("/")
+            hostname_lower = (parsed.hostname or "").lower()
+            raw_path = parsed.path
+            path = raw_path.strip("/")
         except Exception:
             return False
         
         # Check if URL belongs to the correct platform using hostname parsing
         # This prevents substring matching vulnerabilities (e.g., "fakex.com")
-        if platform_id == "x":
-            # X can be either x.com or twitter.com
-            valid_hosts = ["x.com", "www.x.com", "twitter.com", "www.twitter.com"]
-            if hostname_lower not in valid_hosts:
-                return False
-        elif platform_id == "linkedin":
-            # LinkedIn must be linkedin.com domain and have /in/ path
-            valid_hosts = ["linkedin.com", "www.linkedin.com"]
-            if hostname_lower not in valid_hosts:
-                return False
-            if not path.startswith("in/"):
-                return False
-        else:
-            # Other platforms - check exact domain
-            valid_hosts = [f"{platform_id}.com", f"www.{platform_id}.com"]
-            if hostname_lower not in valid_hosts:
-                return False
+        if hostname_lower not in self.VALID_HOSTS[platform_id]:
+            return False
+        
+        # LinkedIn profiles must live under the /in/ path
+        if platform_id == "linkedin" and not path.startswith("in/"):
+            return False
+        
+        # Reject URLs where any path segment is an excluded page
+        # (search, login, help, etc.)
+        if not self._excluded_segments[platform_id].isdisjoint(
+            path.lower().split("/")
+        ):
+            return False
         
-        # Check against exclude patterns
-        url_lower = url.lower()
         for pattern in self._compiled_exclude_patterns[platform_id]:
-            if pattern.search(url_lower):
+            if pattern.search(raw_path):
                 return False
         
         # Must have a path (username)
@@ -657,19 +1106,18 @@ class LightScanService:
         if path.count("/") > 2:
             return False
         
-        # If we have a profile pattern, use it for additional validation
-        # but don't require it to match (allows for URL variations)
-        profile_pattern = config.get("profile_pattern")
-        if profile_pattern and re.search(profile_pattern, url):
-            return True
-        
-        # If no pattern match, still accept if basic validation passed
+        # The platform's profile_pattern is deliberately not required to
+        # match (allows for URL variations), so basic validation suffices
         return True
     
     # -------------------------------------------------------------------------
     # UTILITY METHODS
     # -------------------------------------------------------------------------
     
+    def is_cse_configured(self) -> bool:
+        """Check if the Google Custom Search JSON API is configured."""
+        return bool(self._cse_key and self._cse_cx)
+    
     def get_supported_platforms(self) -> List[str]:
         """Get list of supported platform IDs."""
         return list(self.PLATFORMS.keys())
@@ -683,12 +1131,11 @@ class LightScanService:
 # MODULE-LEVEL CONVENIENCE FUNCTION
 # =============================================================================
 
-_default_service = None
-
-
+@functools.cache
 def get_light_scan_service() -> LightScanService:
-    """Get or create the default LightScanService instance."""
-    global _default_service
-    if _default_service is None:
-        _default_service = LightScanService()
-    return _default_service
+    """
+    Get or create the default LightScanService instance.
+    
+    Use get_light_scan_service.cache_clear() to reset it in tests.
+    """
+    return LightScanService()
@@ -29,8 +29,11 @@ Example Usage:
     # Returns: {"name": "John Doe", "bio": "...", ...}
 """
 
+import asyncio
 import re
-from typing import Dict, Optional, Any
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urlparse
 import logging
 
@@ -41,14 +44,126 @@ except ImportError:
     HTTPX_AVAILABLE = False
 
 try:
-    from bs4 import BeautifulSoup
-    BS4_AVAILABLE = True
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    HTTP2_AVAILABLE = True
 except ImportError:
-    BS4_AVAILABLE = False
+    HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401 - enables httpx Brotli decoding
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    from lxml import etree, html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Only <meta> tags are ever read from profile pages; a single compiled
+# XPath collects them all in one C-level pass
+_META_XPATH = etree.XPath("//meta[@property or @name]") if LXML_AVAILABLE else None
+
+# -----------------------------------------------------------------------------
+# Platform-specific og:title / og:description cleaners
+# -----------------------------------------------------------------------------
+
+# Leading display name before an "@handle" or "(" in a title
+_NAME_PREFIX_RE = re.compile(r"^([^@(]+)")
+
+# Instagram follower stats prefix: "1,234 Followers, 56 Following, 78 Posts - "
+_IG_STATS_RE = re.compile(r"^\d[\d,.KMBkmb ]*\s+Followers?,.*?\s-\s")
+
+
+def _clean_handle_title(title: str) -> str:
+    """Instagram "Name (@username) • Instagram..." / X "Name (@username) / X"."""
+    match = _NAME_PREFIX_RE.match(title)
+    return match.group(1).strip() if match else title
+
+
+def _clean_facebook_title(title: str) -> str:
+    """Facebook format: "Name | Facebook"."""
+    return title.partition("|")[0].strip()
+
+
+def _clean_linkedin_title(title: str) -> str:
+    """LinkedIn format: "Name - Title | LinkedIn"."""
+    return title.partition("-")[0].strip()
+
+
+def _clean_instagram_bio(description: str) -> Optional[str]:
+    """Skip the "X Followers, Y Following, Z Posts - " stats prefix."""
+    match = _IG_STATS_RE.match(description)
+    if match:
+        bio_part = description[match.end():]
+        if "See Instagram" not in bio_part:
+            return bio_part.strip()
+    return description
+
+
+def _clean_facebook_bio(description: str) -> Optional[str]:
+    """Drop Facebook's generic "See photos..." placeholder description."""
+    if "See photos, profile pictures and albums from" in description:
+        return None
+    return description
+
+
+_NAME_CLEANERS = {
+    "instagram": _clean_handle_title,
+    "facebook": _clean_facebook_title,
+    "linkedin": _clean_linkedin_title,
+    "x": _clean_handle_title,
+}
+
+_BIO_CLEANERS = {
+    "instagram": _clean_instagram_bio,
+    "facebook": _clean_facebook_bio,
+}
+
+# Shared HTTP client: keeps connections (and TLS sessions) alive across
+# profile fetches instead of opening a new client per request
+_shared_client: Optional["httpx.AsyncClient"] = None
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+
+def _get_shared_client() -> "httpx.AsyncClient":
+    """Get or lazily create the shared pooled HTTP client."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=SocialMediaDataCollector.REQUEST_TIMEOUT,
+            follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
+            # Idle connections are kept for a minute so back-to-back scans
+            # of the same platforms skip DNS, TCP and TLS setup entirely.
+            # HTTP/2 connections survive _read_head stopping early; HTTP/1.1
+            # ones only when the rest of the body was small enough to drain
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+            )
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
 
 class SocialMediaDataCollector:
     """
@@ -77,6 +192,40 @@ class SocialMediaDataCollector:
     # Request timeout
     REQUEST_TIMEOUT = 15.0
     
+    # Profile pages are highly compressible HTML; only advertise Brotli
+    # when httpx can decode it
+    DEFAULT_HEADERS = {
+        "User-Agent": DEFAULT_USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Encoding": "br, gzip, deflate" if BROTLI_AVAILABLE else "gzip, deflate",
+        "Accept-Language": "en-US,en;q=0.9"
+    }
+    
+    # Successful collections are reused for repeat lookups of the same URL
+    PROFILE_CACHE_TTL_SECONDS = 300  # 5 minutes
+    PROFILE_CACHE_MAX_SIZE = 1024
+    
+    # Failed fetches (404s, timeouts, ...) are remembered briefly so a
+    # dead URL does not cost a full timeout on every lookup
+    NEGATIVE_CACHE_TTL_SECONDS = 60
+    
+    # Every extracted field lives in <head>; stop reading after it closes
+    # or after this many bytes, whichever comes first
+    MAX_HEAD_BYTES = 65536
+    
+    # Stopping early closes an HTTP/1.1 connection instead of returning it
+    # to the pool; remainders up to this size (by Content-Length) are read
+    # and discarded so the connection stays reusable
+    MAX_DRAIN_BYTES = 131072
+    
+    # Per-host concurrency and adaptive backoff (doubles on 429/5xx,
+    # decays on success)
+    MAX_CONCURRENT_PER_HOST = 4
+    BACKOFF_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    HOST_BACKOFF_INITIAL = 1.0  # seconds
+    HOST_BACKOFF_MAX = 60.0  # seconds
+    HOST_BACKOFF_DECAY = 0.9
+    
     # Allowed domains for SSRF protection
     ALLOWED_DOMAINS = {
         "facebook": ["www.facebook.com", "facebook.com", "m.facebook.com"],
@@ -85,9 +234,40 @@ class SocialMediaDataCollector:
         "x": ["x.com", "www.x.com", "twitter.com", "www.twitter.com"]
     }
     
-    def __init__(self):
-        """Initialize the Social Media Data Collector."""
-        pass
+    def __init__(self, client: Optional["httpx.AsyncClient"] = None):
+        """
+        Initialize the Social Media Data Collector.
+        
+        Args:
+            client: Optional HTTP client to use instead of the shared
+                pooled client (mainly for tests)
+        """
+        self._client = client
+        
+        # Profile cache: (url, platform) -> (timestamp, result), least
+        # recently used first; failed results expire sooner. Per-key locks
+        # collapse concurrent fetches and are dropped only once no task
+        # holds or waits on them
+        self._profile_cache: OrderedDict = OrderedDict()
+        self._fetch_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._fetch_lock_users: Dict[Tuple[str, str], int] = {}
+        
+        # Per-host governors keyed by netloc
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_delays: Dict[str, float] = {}
+    
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Get the HTTP client used for profile fetches."""
+        if self._client is not None:
+            return self._client
+        return _get_shared_client()
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client used by this collector."""
+        if self._client is not None:
+            await self._client.aclose()
+        else:
+            await close_shared_client()
     
     def _is_url_allowed(self, url: str, platform: str) -> bool:
         """
@@ -158,25 +338,14 @@ class SocialMediaDataCollector:
                 'error': None
             }
         """
-        result = {
-            "url": url,
-            "platform": platform,
-            "name": None,
-            "bio": None,
-            "profile_image": None,
-            "location": None,
-            "raw_title": None,
-            "raw_description": None,
-            "success": False,
-            "error": None
-        }
+        result = self._empty_result(url, platform)
         
         if not HTTPX_AVAILABLE:
             result["error"] = "httpx library not available"
             return result
         
-        if not BS4_AVAILABLE:
-            result["error"] = "beautifulsoup4 library not available"
+        if not (SELECTOLAX_AVAILABLE or LXML_AVAILABLE):
+            result["error"] = "No HTML parser available (install selectolax or lxml)"
             return result
         
         if not url:
@@ -188,210 +357,447 @@ class SocialMediaDataCollector:
             result["error"] = f"URL domain not allowed for platform {platform}"
             return result
         
+        key = (url, platform)
+        cached = self._get_cached_profile(key)
+        if cached is not None:
+            return cached
+        
+        lock = self._fetch_locks.setdefault(key, asyncio.Lock())
+        self._fetch_lock_users[key] = self._fetch_lock_users.get(key, 0) + 1
         try:
-            async with httpx.AsyncClient(
-                timeout=self.REQUEST_TIMEOUT,
-                follow_redirects=True
-            ) as client:
-                headers = {
-                    "User-Agent": self.DEFAULT_USER_AGENT,
-                    "Accept": "text/html,application/xhtml+xml",
-                    "Accept-Language": "en-US,en;q=0.9"
-                }
-                
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code != 200:
-                    result["error"] = f"HTTP {response.status_code}"
-                    return result
-                
-                # Parse HTML
-                soup = BeautifulSoup(response.text, "html.parser")
-                
-                # Extract data
-                result["name"] = self._extract_name(soup, platform)
-                result["bio"] = self._extract_bio(soup, platform)
-                result["profile_image"] = self._extract_profile_image(soup, platform)
-                result["location"] = self._extract_location(soup, platform)
-                
-                # Store raw values for debugging
-                result["raw_title"] = self._get_og_content(soup, "og:title")
-                result["raw_description"] = self._get_og_content(soup, "og:description")
-                
-                result["success"] = True
+            async with lock:
+                # Another caller may have fetched it while we waited
+                cached = self._get_cached_profile(key)
+                if cached is not None:
+                    return cached
                 
+                await self._fetch_profile_data(url, platform, result)
+                self._store_cached_profile(key, result)
+        finally:
+            users = self._fetch_lock_users[key] - 1
+            if users:
+                self._fetch_lock_users[key] = users
+            else:
+                del self._fetch_lock_users[key]
+                del self._fetch_locks[key]
+        
+        return result
+    
+    async def collect_profiles(
+        self,
+        targets: List[Tuple[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect several profiles concurrently.
+        
+        All fetches share the pooled client and run at once, so total time
+        tracks the slowest profile rather than the sum; the per-host
+        semaphores keep the fan-out from flooding any single platform.
+        
+        Args:
+            targets: List of (url, platform) pairs
+        
+        Returns:
+            List of result dicts (see collect_profile_data), in target order
+        """
+        outcomes = await asyncio.gather(
+            *(self.collect_profile_data(url, platform) for url, platform in targets),
+            return_exceptions=True
+        )
+        
+        results = []
+        for (url, platform), outcome in zip(targets, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Error collecting data from %s: %s", url, outcome)
+                error = f"Unexpected error: {str(outcome)}"
+                outcome = self._empty_result(url, platform)
+                outcome["error"] = error
+            results.append(outcome)
+        return results
+    
+    @staticmethod
+    def _empty_result(url: str, platform: str) -> Dict[str, Any]:
+        """Build a result dict with no data collected yet."""
+        return {
+            "url": url,
+            "platform": platform,
+            "name": None,
+            "bio": None,
+            "profile_image": None,
+            "location": None,
+            "raw_title": None,
+            "raw_description": None,
+            "success": False,
+            "error": None
+        }
+    
+    async def _fetch_profile_data(
+        self,
+        url: str,
+        platform: str,
+        result: Dict[str, Any]
+    ) -> None:
+        """
+        Fetch and parse a profile page, filling in the result dict in place.
+        
+        Args:
+            url: The (already validated) profile URL
+            platform: Platform ID
+            result: Result dict to populate
+        """
+        try:
+            client = self._get_client()
+            
+            host = urlparse(url).netloc.lower()
+            delay = self._host_delays.get(host)
+            if delay:
+                await asyncio.sleep(delay)
+            
+            semaphore = self._host_semaphores.setdefault(
+                host, asyncio.Semaphore(self.MAX_CONCURRENT_PER_HOST)
+            )
+            async with semaphore:
+                async with client.stream("GET", url, headers=self.DEFAULT_HEADERS) as response:
+                    self._record_host_response(host, response)
+                    
+                    if response.status_code != 200:
+                        result["error"] = f"HTTP {response.status_code}"
+                        return
+                    
+                    # JSON/redirect-bridge bodies have no meta tags worth
+                    # parsing; a missing header is still given a chance
+                    content_type = response.headers.get("content-type", "")
+                    if content_type and "html" not in content_type.lower():
+                        result["error"] = f"Non-HTML content-type: {content_type}"
+                        return
+                    
+                    content = await self._read_head(response)
+            
+            # Parse HTML
+            meta = self._parse_html(content)
+            
+            # Extract data
+            result["name"] = self._extract_name(meta, platform)
+            result["bio"] = self._extract_bio(meta, platform)
+            result["profile_image"] = self._extract_profile_image(meta, platform)
+            result["location"] = self._extract_location(meta, platform)
+            
+            # Store raw values for debugging
+            result["raw_title"] = self._get_og_content(meta, "og:title")
+            result["raw_description"] = self._get_og_content(meta, "og:description")
+            
+            result["success"] = True
+            
         except httpx.TimeoutException:
             result["error"] = "Request timed out"
         except httpx.RequestError as e:
             result["error"] = f"Request error: {str(e)}"
         except Exception as e:
-            logger.error(f"Error collecting data from {url}: {e}")
+            logger.error("Error collecting data from %s: %s", url, e)
             result["error"] = f"Unexpected error: {str(e)}"
+    
+    def _record_host_response(self, host: str, response: "httpx.Response") -> None:
+        """
+        Adjust a host's request delay from the status of its latest response.
         
-        return result
+        Throttling and server errors double the delay (honouring a numeric
+        Retry-After header, capped at HOST_BACKOFF_MAX); other responses
+        let it decay back towards zero.
+        
+        Args:
+            host: Host (netloc) the request was sent to
+            response: The response received
+        """
+        delay = self._host_delays.get(host, 0.0)
+        
+        if response.status_code in self.BACKOFF_STATUS_CODES:
+            delay = max(delay * 2, self.HOST_BACKOFF_INITIAL)
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            self._host_delays[host] = min(delay, self.HOST_BACKOFF_MAX)
+            logger.warning(
+                "HTTP %d from %s, delaying requests by %.1fs",
+                response.status_code, host, self._host_delays[host]
+            )
+        elif delay:
+            delay *= self.HOST_BACKOFF_DECAY
+            if delay < 0.05:
+                self._host_delays.pop(host, None)
+            else:
+                self._host_delays[host] = delay
+    
+    async def _read_head(self, response: "httpx.Response") -> bytes:
+        """
+        Read a streamed response body up to the end of its <head>.
+        
+        Profile pages run to hundreds of kilobytes, but the meta tags sit
+        at the top. Reading stops at the first </head> or MAX_HEAD_BYTES
+        and anything after </head> is sliced off.
+        
+        Leaving the stream context with body bytes unread resets an HTTP/2
+        stream (the connection is kept) but closes an HTTP/1.1 connection.
+        For HTTP/1.1, a known remainder of at most MAX_DRAIN_BYTES is
+        drained so the connection goes back to the pool; larger or
+        unsized (chunked) remainders are abandoned with the connection.
+        
+        Args:
+            response: An open streaming response
+        
+        Returns:
+            The leading bytes of the page
+        """
+        buffer = bytearray()
+        chunks = response.aiter_bytes()
+        stopped_early = False
+        async for chunk in chunks:
+            # Only rescan the tail so a marker split across chunks is found
+            search_from = max(0, len(buffer) - len(b"</head>"))
+            buffer += chunk
+            end = buffer.find(b"</head>", search_from)
+            if end != -1:
+                # The final chunk usually carries body markup past the
+                # head; drop it so parse time tracks head size only
+                del buffer[end + len(b"</head>"):]
+                stopped_early = True
+                break
+            if len(buffer) >= self.MAX_HEAD_BYTES:
+                stopped_early = True
+                break
+        
+        if stopped_early and self._should_drain(response):
+            async for _ in chunks:
+                pass
+        
+        return bytes(buffer)
+    
+    def _should_drain(self, response: "httpx.Response") -> bool:
+        """
+        Check whether the unread body is small enough to drain.
+        
+        Args:
+            response: A streaming response that has been partly read
+        
+        Returns:
+            True for HTTP/1.1 responses with at most MAX_DRAIN_BYTES left
+        """
+        if response.http_version != "HTTP/1.1":
+            return False
+        try:
+            content_length = int(response.headers.get("content-length", ""))
+        except ValueError:
+            return False
+        remaining = content_length - response.num_bytes_downloaded
+        return 0 < remaining <= self.MAX_DRAIN_BYTES
+    
+    def _get_cached_profile(
+        self,
+        key: Tuple[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get a copy of a cached profile result if present and not expired."""
+        entry = self._profile_cache.get(key)
+        if entry is None:
+            return None
+        
+        timestamp, result = entry
+        ttl = (
+            self.PROFILE_CACHE_TTL_SECONDS if result["success"]
+            else self.NEGATIVE_CACHE_TTL_SECONDS
+        )
+        if time.time() - timestamp > ttl:
+            del self._profile_cache[key]
+            return None
+        
+        self._profile_cache.move_to_end(key)
+        return dict(result)
+    
+    def _store_cached_profile(
+        self,
+        key: Tuple[str, str],
+        result: Dict[str, Any]
+    ) -> None:
+        """Store a profile result, evicting the least recently used entries."""
+        self._profile_cache[key] = (time.time(), dict(result))
+        self._profile_cache.move_to_end(key)
+        while len(self._profile_cache) > self.PROFILE_CACHE_MAX_SIZE:
+            self._profile_cache.popitem(last=False)
+    
+    def invalidate(self, url: str) -> None:
+        """
+        Drop any cached collection results for a URL.
+        
+        Args:
+            url: The profile URL to refresh on next collection
+        """
+        for key in [k for k in self._profile_cache if k[0] == url]:
+            del self._profile_cache[key]
     
-    def _get_og_content(self, soup: Any, property_name: str) -> Optional[str]:
+    def _parse_html(self, content: bytes) -> Dict[str, str]:
+        """
+        Parse the <meta> tags of an HTML page into a lookup map.
+        
+        Uses selectolax (Lexbor, in C) when installed and falls back to
+        lxml otherwise. Both take raw bytes so encoding detection stays in
+        C. Each meta tag is keyed by its property (Open Graph) or name
+        attribute; the first non-empty content for a key wins.
+        
+        Args:
+            content: Raw response body
+        
+        Returns:
+            Dict mapping meta property/name to stripped content
+        """
+        if SELECTOLAX_AVAILABLE:
+            return self._parse_html_selectolax(content)
+        return self._parse_html_lxml(content)
+    
+    @staticmethod
+    def _parse_html_selectolax(content: bytes) -> Dict[str, str]:
+        """Build the meta map with selectolax's CSS selector engine."""
+        meta: Dict[str, str] = {}
+        if not content:
+            return meta
+        
+        tree = HTMLParser(content)
+        for node in tree.css("meta[property], meta[name]"):
+            attributes = node.attributes
+            value = attributes.get("content")
+            if value:
+                key = attributes.get("property") or attributes.get("name")
+                meta.setdefault(key, value.strip())
+        return meta
+    
+    @staticmethod
+    def _parse_html_lxml(content: bytes) -> Dict[str, str]:
+        """Build the meta map with a single compiled lxml XPath."""
+        meta: Dict[str, str] = {}
+        try:
+            document = lxml_html.fromstring(content)
+        except (etree.ParserError, ValueError):
+            return meta
+        
+        for element in _META_XPATH(document):
+            value = element.get("content")
+            if value:
+                key = element.get("property") or element.get("name")
+                meta.setdefault(key, value.strip())
+        return meta
+    
+    def _get_og_content(self, meta: Dict[str, str], property_name: str) -> Optional[str]:
         """
         Get content from an Open Graph meta tag.
         
         Args:
-            soup: BeautifulSoup object
+            meta: Meta tag map from _parse_html
             property_name: The og: property name (e.g., "og:title")
         
         Returns:
             str: Content value or None if not found
         """
-        tag = soup.find("meta", property=property_name)
-        if tag and tag.get("content"):
-            return tag["content"].strip()
-        return None
+        return meta.get(property_name)
     
-    def _get_meta_content(self, soup: Any, name: str) -> Optional[str]:
+    def _get_meta_content(self, meta: Dict[str, str], name: str) -> Optional[str]:
         """
         Get content from a meta tag by name.
         
         Args:
-            soup: BeautifulSoup object
+            meta: Meta tag map from _parse_html
             name: The meta name attribute
         
         Returns:
             str: Content value or None if not found
         """
-        tag = soup.find("meta", attrs={"name": name})
-        if tag and tag.get("content"):
-            return tag["content"].strip()
-        return None
+        return meta.get(name)
     
-    def _extract_name(self, soup: Any, platform: str) -> Optional[str]:
+    def _extract_name(self, meta: Dict[str, str], platform: str) -> Optional[str]:
         """
         Extract display name from profile page.
         
         Uses og:title meta tag with platform-specific cleaning.
         
         Args:
-            soup: BeautifulSoup object
+            meta: Meta tag map from _parse_html
             platform: Platform ID
         
         Returns:
             str: Display name or None
         """
-        og_title = self._get_og_content(soup, "og:title")
+        og_title = self._get_og_content(meta, "og:title")
         
         if not og_title:
             return None
         
         # Platform-specific cleaning
-        if platform == "instagram":
-            # Instagram format: "Name (@username) • Instagram photos and videos"
-            match = re.match(r"^([^@(]+)", og_title)
-            if match:
-                return match.group(1).strip()
-        
-        elif platform == "facebook":
-            # Facebook format: "Name | Facebook"
-            parts = og_title.split("|")
-            if parts:
-                return parts[0].strip()
-        
-        elif platform == "linkedin":
-            # LinkedIn format: "Name - Title | LinkedIn"
-            parts = og_title.split("-")
-            if parts:
-                return parts[0].strip()
-        
-        elif platform == "x":
-            # X format: "Name (@username) / X"
-            match = re.match(r"^([^@(]+)", og_title)
-            if match:
-                return match.group(1).strip()
-        
-        return og_title
-    
-    def _extract_bio(self, soup: Any, platform: str) -> Optional[str]:
+        cleaner = _NAME_CLEANERS.get(platform)
+        return cleaner(og_title) if cleaner else og_title
+    
+    def _extract_bio(self, meta: Dict[str, str], platform: str) -> Optional[str]:
         """
         Extract bio/description from profile page.
         
         Uses og:description meta tag with platform-specific cleaning.
         
         Args:
-            soup: BeautifulSoup object
+            meta: Meta tag map from _parse_html
             platform: Platform ID
         
         Returns:
             str: Bio text or None
         """
-        og_description = self._get_og_content(soup, "og:description")
+        og_description = self._get_og_content(meta, "og:description")
         
         if not og_description:
             # Try regular description meta tag
-            og_description = self._get_meta_content(soup, "description")
+            og_description = self._get_meta_content(meta, "description")
         
         if not og_description:
             return None
         
-        # Platform-specific cleaning
-        if platform == "instagram":
-            # Instagram format: "X Followers, Y Following, Z Posts - See Instagram..."
-            # Try to extract actual bio
-            parts = og_description.split(" - ")
-            if len(parts) > 1:
-                # Skip the follower stats
-                bio_part = " - ".join(parts[1:])
-                if "See Instagram" not in bio_part:
-                    return bio_part.strip()
-        
-        elif platform == "facebook":
-            # Clean up common Facebook suffixes
-            bio = og_description.replace("See photos, profile pictures and albums from", "").strip()
-            if bio != og_description:
-                return None  # This was just the default text
-        
-        elif platform == "x":
-            # X descriptions are usually the actual bio
-            pass
-        
-        return og_description
-    
-    def _extract_profile_image(self, soup: Any, platform: str) -> Optional[str]:
+        # Platform-specific cleaning (X descriptions are usually the
+        # actual bio, so X has no cleaner)
+        cleaner = _BIO_CLEANERS.get(platform)
+        return cleaner(og_description) if cleaner else og_description
+    
+    def _extract_profile_image(self, meta: Dict[str, str], platform: str) -> Optional[str]:
         """
         Extract profile image URL from profile page.
         
         Uses og:image meta tag.
         
         Args:
-            soup: BeautifulSoup object
+            meta: Meta tag map from _parse_html
             platform: Platform ID
         
         Returns:
             str: Profile image URL or None
         """
-        return self._get_og_content(soup, "og:image")
+        return self._get_og_content(meta, "og:image")
     
-    def _extract_location(self, soup: Any, platform: str) -> Optional[str]:
+    def _extract_location(self, meta: Dict[str, str], platform: str) -> Optional[str]:
         """
         Extract location from profile page.
         
         Tries various meta tags and HTML elements for location data.
         
         Args:
-            soup: BeautifulSoup object
+            meta: Meta tag map from _parse_html
             platform: Platform ID
         
         Returns:
             str: Location or None
         """
         # Try og:locality
-        location = self._get_og_content(soup, "og:locality")
+        location = self._get_og_content(meta, "og:locality")
         if location:
             return location
         
         # Try og:region
-        region = self._get_og_content(soup, "og:region")
+        region = self._get_og_content(meta, "og:region")
         if region:
             return region
         
         # Try profile:location
-        profile_location = self._get_og_content(soup, "profile:location")
+        profile_location = self._get_og_content(meta, "profile:location")
         if profile_location:
             return profile_location
         
@@ -405,9 +811,24 @@ class SocialMediaDataCollector:
 # MODULE-LEVEL CONVENIENCE FUNCTIONS
 # =============================================================================
 
-_default_collector = SocialMediaDataCollector()
+_default_collector: Optional[SocialMediaDataCollector] = None
+
+
+def get_default_collector() -> SocialMediaDataCollector:
+    """Get or lazily create the module-level default collector."""
+    global _default_collector
+    if _default_collector is None:
+        _default_collector = SocialMediaDataCollector()
+    return _default_collector
 
 
 async def collect_profile_data(url: str, platform: str) -> Dict[str, Any]:
     """Module-level convenience function for profile data collection."""
-    return await _default_collector.collect_profile_data(url, platform)
+    return await get_default_collector().collect_profile_data(url, platform)
+
+
+async def aclose_default() -> None:
+    """Drop the default collector and close the shared HTTP client (call on shutdown)."""
+    global _default_collector
+    _default_collector = None
+    await close_shared_client()
@@ -20,9 +20,166 @@ Example Usage:
     # Returns comprehensive exposure report with clear PII listing
 """
 
+import functools
 import re
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+
+
+# -----------------------------------------------------------------------------
+# Precompiled PII patterns
+# -----------------------------------------------------------------------------
+# Compiled once at import; bios are scanned for every found profile
+
+# Email addresses
+_EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b'
+
+# Sri Lankan phone numbers
+# Matches: +94 77 123 4567, 0771234567, 077-123-4567, etc.
+# Anchored so it cannot start or end inside a longer digit run (card
+# numbers, IDs); a lookbehind is used because "+" is not a word character
+_PHONE_PATTERN = r'(?<![\w+])(?:\+94|0)?[0-9]{2}[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b'
+
+# URLs
+_URL_PATTERN = r'https?://[^\s<>"{}|\\^`\[\]]+'
+
+# All three in one alternation so text is scanned in a single pass; group
+# names match the extract_pii_from_text keys. Emails and URLs are tried
+# first so digits inside them are not reported as phone numbers. A URL
+# match consumes its whole link, so emails inside it (e.g. "?contact=...")
+# are picked up separately with _EMAIL_RE.
+_PII_RE = re.compile(
+    f'(?P<emails>{_EMAIL_PATTERN})'
+    f'|(?P<urls>{_URL_PATTERN})'
+    f'|(?P<phones>{_PHONE_PATTERN})'
+)
+_EMAIL_RE = re.compile(_EMAIL_PATTERN)
+
+# Cheap prefilter: phone numbers need at least one digit
+_DIGIT_RE = re.compile(r'[0-9]')
+
+# Everything except digits and "+" (phone normalization)
+_PHONE_CLEAN_RE = re.compile(r'[^\d+]')
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_phone(phone: str) -> str:
+    """
+    Normalize a phone number to +94 format (cached; the same numbers are
+    normalized repeatedly while consolidating and matching).
+    
+    Args:
+        phone: Phone number in any format
+        
+    Returns:
+        Normalized phone number (digits only, with country code)
+    """
+    if not phone:
+        return ""
+    
+    # Remove all non-digit characters except +
+    cleaned = _PHONE_CLEAN_RE.sub('', phone)
+    
+    # Convert to standard format
+    if cleaned.startswith('+94'):
+        return cleaned
+    elif cleaned.startswith('0094'):
+        return '+94' + cleaned[4:]
+    elif cleaned.startswith('94') and len(cleaned) >= 11:
+        return '+' + cleaned
+    elif cleaned.startswith('0') and len(cleaned) >= 10:
+        return '+94' + cleaned[1:]
+    
+    return cleaned
+
+
+def _match_phone(value: str, identifiers: Dict[str, str]) -> bool:
+    """Exact match against the user's normalized phone number."""
+    phone = identifiers.get("phone")
+    return phone is not None and _normalize_phone(value) == phone
+
+
+def _match_email(value: str, identifiers: Dict[str, str]) -> bool:
+    """Case-insensitive exact match against the user's email."""
+    email = identifiers.get("email")
+    return email is not None and value.strip().lower() == email
+
+
+def _match_name(value: str, identifiers: Dict[str, str]) -> bool:
+    """Fuzzy name match, or the username appearing in the display name."""
+    lowered = value.strip().lower()
+    
+    user_name = identifiers.get("name")
+    if user_name is not None and (
+        lowered == user_name or user_name in lowered or lowered in user_name
+    ):
+        return True
+    
+    username = identifiers.get("username")
+    return username is not None and username in lowered.replace(" ", "")
+
+
+# PII types that can be matched to user input, by type
+_IDENTIFIER_MATCHERS = {
+    "phone": _match_phone,
+    "email": _match_email,
+    "name": _match_name,
+}
+
+
+@dataclass(slots=True)
+class _PIIItem:
+    """
+    A consolidated PII item while platforms are being merged.
+    
+    Attributes:
+        type: PII type (name, email, phone, ...)
+        value: Value as first seen
+        platforms: Platforms the item appears on, in discovery order
+            (a dict used as an ordered set)
+    """
+    type: str
+    value: str
+    platforms: Dict[str, None]
+
+
+def _copy_report(report: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy an exposure report so callers can mutate it freely.
+    
+    A structural copy of the known report layout (much cheaper than
+    copy.deepcopy); each PII item is copied once and shared between
+    exposed_pii and platform_breakdown, as in the original.
+    
+    Args:
+        report: Report built by PIIExposureAnalyzer._build_report
+        
+    Returns:
+        An independent copy of the report
+    """
+    items = {}
+    for item in report["exposed_pii"]:
+        item_copy = dict(item)
+        item_copy["platforms"] = list(item["platforms"])
+        items[id(item)] = item_copy
+    
+    copied = dict(report)
+    copied["user_identifiers"] = dict(report["user_identifiers"])
+    copied["platforms_checked"] = list(report["platforms_checked"])
+    copied["profiles_found"] = list(report["profiles_found"])
+    copied["profiles_not_found"] = list(report["profiles_not_found"])
+    copied["exposed_pii"] = list(items.values())
+    copied["platform_breakdown"] = {
+        platform: {
+            **entry,
+            "exposed_items": [items[id(item)] for item in entry["exposed_items"]],
+        }
+        for platform, entry in report["platform_breakdown"].items()
+    }
+    copied["recommendations"] = list(report["recommendations"])
+    return copied
 
 
 class PIIExposureAnalyzer:
@@ -48,6 +205,21 @@ class PIIExposureAnalyzer:
         "website": "low",
     }
     
+    # Platform statuses that mean a profile was found
+    FOUND_STATUSES = frozenset({"found", "exists"})
+    
+    # Scraped profile fields consolidated as PII, in report order
+    PROFILE_PII_FIELDS = (
+        "name",
+        "bio",
+        "location",
+        "workplace",
+        "email",
+        "phone",
+        "profile_image",
+        "website",
+    )
+    
     # Risk level weights for score calculation
     RISK_WEIGHTS = {
         "critical": 30,
@@ -56,9 +228,19 @@ class PIIExposureAnalyzer:
         "low": 5
     }
     
+    # Only this much of a bio/about text is scanned for PII
+    MAX_PII_TEXT_LENGTH = 8192
+    
+    # Reports for identical inputs are reused briefly (batch callers often
+    # re-analyze the same scan)
+    REPORT_CACHE_TTL_SECONDS = 60
+    REPORT_CACHE_MAX_SIZE = 128
+    
     def __init__(self):
         """Initialize the PII Exposure Analyzer."""
-        pass
+        # Report cache: input key -> (timestamp, report), least
+        # recently used first
+        self._report_cache: OrderedDict = OrderedDict()
     
     def analyze(
         self,
@@ -81,29 +263,110 @@ class PIIExposureAnalyzer:
         Returns:
             Comprehensive exposure report with clear PII listing
         """
-        # Get current timestamp (timezone-aware UTC)
-        scan_timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        key = self._report_cache_key(platform_data, user_identifiers)
+        if key is None:
+            return self._build_report(platform_data, user_identifiers)
+        
+        entry = self._report_cache.get(key)
+        if entry is not None:
+            cached_at, cached_report = entry
+            if time.time() - cached_at <= self.REPORT_CACHE_TTL_SECONDS:
+                self._report_cache.move_to_end(key)
+                report = _copy_report(cached_report)
+                report["scan_timestamp"] = self._scan_timestamp()
+                return report
+            del self._report_cache[key]
+        
+        # The cache keeps the built report; callers always get copies
+        report = self._build_report(platform_data, user_identifiers)
+        
+        self._report_cache[key] = (time.time(), report)
+        while len(self._report_cache) > self.REPORT_CACHE_MAX_SIZE:
+            self._report_cache.popitem(last=False)
+        
+        return _copy_report(report)
+    
+    def _report_cache_key(
+        self,
+        platform_data: Dict[str, Dict],
+        user_identifiers: Dict[str, str]
+    ) -> Optional[Tuple]:
+        """
+        Build a report cache key from the inputs the report depends on.
+        
+        Only the user identifiers and each platform's status, URL and PII
+        fields feed the report, so other scraped data (follower counts,
+        raw HTML, ...) is left out of the key.
         
-        # Extract platform status lists
-        platforms_checked = list(platform_data.keys())
+        Args:
+            platform_data: Scraped data from each platform
+            user_identifiers: User-provided identifiers
+            
+        Returns:
+            A hashable key, or None if the inputs are not hashable
+        """
+        fields = self.PROFILE_PII_FIELDS
+        key = (
+            tuple(user_identifiers.items()),
+            tuple(
+                (
+                    platform,
+                    data.get("status", "unknown"),
+                    data.get("url", ""),
+                    tuple(map((data.get("data") or {}).get, fields)),
+                )
+                for platform, data in platform_data.items()
+            ),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    @staticmethod
+    def _scan_timestamp() -> str:
+        """Get the current UTC time as an ISO 8601 string (second precision)."""
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    
+    def _build_report(
+        self,
+        platform_data: Dict[str, Dict],
+        user_identifiers: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """
+        Build the exposure report (uncached; see analyze).
+        
+        Args:
+            platform_data: Scraped data from each platform
+            user_identifiers: User-provided identifiers to match against
+            
+        Returns:
+            Comprehensive exposure report with clear PII listing
+        """
+        # Get current timestamp (UTC, second precision)
+        scan_timestamp = self._scan_timestamp()
+        
+        # Extract platform status lists in a single pass
+        platforms_checked = []
         profiles_found = []
         profiles_not_found = []
         
         for platform, data in platform_data.items():
+            platforms_checked.append(platform)
             status = data.get("status", "unknown")
-            if status in ["found", "exists"]:
+            if status in self.FOUND_STATUSES:
                 profiles_found.append(platform)
-            elif status in ["not_found"]:
+            elif status == "not_found":
                 profiles_not_found.append(platform)
         
         # Consolidate PII from all platforms
         exposed_pii = self._consolidate_pii(platform_data)
         
-        # Match exposed PII to user's provided identifiers
-        matched_pii = self._match_to_user_identifiers(exposed_pii, user_identifiers)
-        
-        # Calculate exposure score
-        exposure_score = self._calculate_exposure_score(matched_pii)
+        # Match exposed PII to user's provided identifiers and calculate the
+        # exposure score in the same pass over the items
+        exposure_score = self._match_and_score(exposed_pii, user_identifiers)
+        matched_pii = exposed_pii
         
         # Determine risk level
         risk_level = self._determine_risk_level(exposure_score)
@@ -138,165 +401,75 @@ class PIIExposureAnalyzer:
         Returns:
             List of exposed PII items with platform sources
         """
-        # Dictionary to track unique PII items by type and value
-        pii_map: Dict[str, Dict] = {}
+        # Unique PII items by (type, normalized value) key
+        pii_map: Dict[Tuple[str, str], _PIIItem] = {}
+        
+        def add(pii_type: str, key: str, value: str, platform: str) -> None:
+            map_key = (pii_type, key)
+            item = pii_map.get(map_key)
+            if item is None:
+                pii_map[map_key] = _PIIItem(pii_type, value, {platform: None})
+            else:
+                item.platforms[platform] = None
+        
+        # Bind hot lookups to locals once rather than per field
+        fields = self.PROFILE_PII_FIELDS
+        extract_pii = self.extract_pii_from_text
+        normalize_phone = _normalize_phone
         
         for platform, data in platform_data.items():
             status = data.get("status", "unknown")
             
             # Only process found profiles
-            if status not in ["found", "exists"]:
+            if status not in self.FOUND_STATUSES:
                 continue
             
             scraped = data.get("data", {})
-            url = data.get("url", "")
-            
-            # Extract name
-            if scraped.get("name"):
-                name = scraped["name"].strip()
-                if name:
-                    key = f"name:{name.lower()}"
-                    if key not in pii_map:
-                        pii_map[key] = {
-                            "type": "name",
-                            "value": name,
-                            "platforms": [platform],
-                        }
-                    elif platform not in pii_map[key]["platforms"]:
-                        pii_map[key]["platforms"].append(platform)
             
-            # Extract bio
-            if scraped.get("bio"):
-                bio = scraped["bio"].strip()
-                if bio:
+            for field in fields:
+                raw = scraped.get(field)
+                if not raw:
+                    continue
+                
+                # Strip once; each branch lowercases at most once
+                value = raw.strip()
+                if not value:
+                    continue
+                
+                if field == "bio":
                     # Also extract PII from bio text
-                    bio_pii = self.extract_pii_from_text(bio)
-                    
-                    # Add extracted emails
+                    bio_pii = extract_pii(value)
                     for email in bio_pii.get("emails", []):
-                        key = f"email:{email.lower()}"
-                        if key not in pii_map:
-                            pii_map[key] = {
-                                "type": "email",
-                                "value": email,
-                                "platforms": [platform],
-                            }
-                        elif platform not in pii_map[key]["platforms"]:
-                            pii_map[key]["platforms"].append(platform)
-                    
-                    # Add extracted phones
+                        add("email", email.lower(), email, platform)
                     for phone in bio_pii.get("phones", []):
-                        key = f"phone:{self._normalize_phone(phone)}"
-                        if key not in pii_map:
-                            pii_map[key] = {
-                                "type": "phone",
-                                "value": phone,
-                                "platforms": [platform],
-                            }
-                        elif platform not in pii_map[key]["platforms"]:
-                            pii_map[key]["platforms"].append(platform)
+                        add("phone", normalize_phone(phone), phone, platform)
                     
-                    # Add bio as its own item
-                    key = f"bio:{bio[:50].lower()}"
-                    if key not in pii_map:
-                        pii_map[key] = {
-                            "type": "bio",
-                            "value": bio[:200] + "..." if len(bio) > 200 else bio,
-                            "platforms": [platform],
-                        }
-                    elif platform not in pii_map[key]["platforms"]:
-                        pii_map[key]["platforms"].append(platform)
-            
-            # Extract location
-            if scraped.get("location"):
-                location = scraped["location"].strip()
-                if location:
-                    key = f"location:{location.lower()}"
-                    if key not in pii_map:
-                        pii_map[key] = {
-                            "type": "location",
-                            "value": location,
-                            "platforms": [platform],
-                        }
-                    elif platform not in pii_map[key]["platforms"]:
-                        pii_map[key]["platforms"].append(platform)
-            
-            # Extract workplace
-            if scraped.get("workplace"):
-                workplace = scraped["workplace"].strip()
-                if workplace:
-                    key = f"workplace:{workplace.lower()}"
-                    if key not in pii_map:
-                        pii_map[key] = {
-                            "type": "workplace",
-                            "value": workplace,
-                            "platforms": [platform],
-                        }
-                    elif platform not in pii_map[key]["platforms"]:
-                        pii_map[key]["platforms"].append(platform)
-            
-            # Extract email if directly available
-            if scraped.get("email"):
-                email = scraped["email"].strip().lower()
-                if email:
-                    key = f"email:{email}"
-                    if key not in pii_map:
-                        pii_map[key] = {
-                            "type": "email",
-                            "value": email,
-                            "platforms": [platform],
-                        }
-                    elif platform not in pii_map[key]["platforms"]:
-                        pii_map[key]["platforms"].append(platform)
-            
-            # Extract phone if directly available
-            if scraped.get("phone"):
-                phone = scraped["phone"].strip()
-                if phone:
-                    key = f"phone:{self._normalize_phone(phone)}"
-                    if key not in pii_map:
-                        pii_map[key] = {
-                            "type": "phone",
-                            "value": phone,
-                            "platforms": [platform],
-                        }
-                    elif platform not in pii_map[key]["platforms"]:
-                        pii_map[key]["platforms"].append(platform)
-            
-            # Extract profile image
-            if scraped.get("profile_image"):
-                profile_image = scraped["profile_image"].strip()
-                if profile_image:
-                    key = f"profile_image:{platform}"  # Unique per platform
-                    pii_map[key] = {
-                        "type": "profile_image",
-                        "value": profile_image,
-                        "platforms": [platform],
-                    }
-            
-            # Extract website
-            if scraped.get("website"):
-                website = scraped["website"].strip()
-                if website:
-                    key = f"website:{website.lower()}"
-                    if key not in pii_map:
-                        pii_map[key] = {
-                            "type": "website",
-                            "value": website,
-                            "platforms": [platform],
-                        }
-                    elif platform not in pii_map[key]["platforms"]:
-                        pii_map[key]["platforms"].append(platform)
+                    # Add bio as its own item, keyed on its opening
+                    key = value[:50].lower()
+                    if len(value) > 200:
+                        value = value[:200] + "..."
+                elif field == "email":
+                    value = value.lower()
+                    key = value
+                elif field == "phone":
+                    key = normalize_phone(value)
+                elif field == "profile_image":
+                    key = platform  # Unique per platform
+                else:
+                    key = value.lower()
+                
+                add(field, key, value, platform)
         
         # Convert to list format
         result = []
         for item in pii_map.values():
+            platforms = list(item.platforms)
             result.append({
-                "type": item["type"],
-                "value": item["value"],
-                "platforms": item["platforms"],
-                "platform_count": len(item["platforms"]),
-                "risk_level": self.PII_RISK_LEVELS.get(item["type"], "low"),
+                "type": item.type,
+                "value": item.value,
+                "platforms": platforms,
+                "platform_count": len(platforms),
+                "risk_level": self.PII_RISK_LEVELS.get(item.type, "low"),
             })
         
         return result
@@ -309,16 +482,66 @@ class PIIExposureAnalyzer:
         """
         Match exposed PII to user's provided identifiers.
         
+        Items are flagged in place by _match_and_score; exposed_pii is the
+        fresh list built by _consolidate_pii, so no copies are made.
+        
         Args:
             exposed_pii: List of exposed PII items
             user_identifiers: User-provided identifiers
             
         Returns:
-            Updated list with matches_user_input flag
+            The same list with a matches_user_input flag on each item
         """
-        result = []
+        self._match_and_score(exposed_pii, user_identifiers)
+        return exposed_pii
+    
+    def _match_and_score(
+        self,
+        exposed_pii: List[Dict],
+        user_identifiers: Optional[Dict[str, str]] = None
+    ) -> int:
+        """
+        Flag user matches and calculate the exposure score in one pass.
         
-        # Normalize user identifiers for matching
+        Args:
+            exposed_pii: List of exposed PII items (flagged in place)
+            user_identifiers: User-provided identifiers; when None, items
+                are scored using their existing matches_user_input flags
+            
+        Returns:
+            Exposure score from 0 (low) to 100 (high)
+        """
+        normalized_identifiers = (
+            self._normalize_identifiers(user_identifiers)
+            if user_identifiers is not None else None
+        )
+        total_weight = 0
+        
+        for item in exposed_pii:
+            if normalized_identifiers is None:
+                matches = item.get("matches_user_input", False)
+            else:
+                matcher = _IDENTIFIER_MATCHERS.get(item["type"])
+                matches = matcher(item["value"], normalized_identifiers) if matcher else False
+                item["matches_user_input"] = matches
+            
+            total_weight += self._item_weight(
+                item.get("risk_level", "low"), matches, item.get("platform_count", 1)
+            )
+        
+        # Normalize to 0-100 scale (cap at 100)
+        return min(total_weight, 100)
+    
+    def _normalize_identifiers(self, user_identifiers: Dict[str, str]) -> Dict[str, str]:
+        """
+        Normalize user identifiers for matching.
+        
+        Args:
+            user_identifiers: User-provided identifiers
+            
+        Returns:
+            Dict of normalized phone/email/name/username values
+        """
         normalized_identifiers = {}
         for key, value in user_identifiers.items():
             if value:
@@ -330,42 +553,31 @@ class PIIExposureAnalyzer:
                     normalized_identifiers[key] = value.strip().lower()
                 elif key == "username":
                     normalized_identifiers[key] = value.strip().lower().lstrip('@')
+        return normalized_identifiers
+    
+    def _item_weight(self, risk_level: str, matches_user_input: bool, platform_count: int) -> int:
+        """
+        Score contribution of a single exposed PII item.
         
-        for item in exposed_pii:
-            matches = False
-            pii_type = item["type"]
-            pii_value = item["value"]
-            
-            # Check for matches based on type
-            if pii_type == "phone" and "phone" in normalized_identifiers:
-                normalized_pii_phone = self._normalize_phone(pii_value)
-                if normalized_pii_phone == normalized_identifiers["phone"]:
-                    matches = True
-            
-            elif pii_type == "email" and "email" in normalized_identifiers:
-                if pii_value.strip().lower() == normalized_identifiers["email"]:
-                    matches = True
-            
-            elif pii_type == "name" and "name" in normalized_identifiers:
-                # Fuzzy match for names
-                pii_name = pii_value.strip().lower()
-                user_name = normalized_identifiers["name"]
-                if pii_name == user_name or user_name in pii_name or pii_name in user_name:
-                    matches = True
-            
-            # Check if username appears in name or bio
-            if "username" in normalized_identifiers:
-                username = normalized_identifiers["username"]
-                if pii_type == "name":
-                    if username in pii_value.lower().replace(" ", ""):
-                        matches = True
+        Args:
+            risk_level: Item risk level
+            matches_user_input: Whether the item matches user input
+            platform_count: Number of platforms the item appears on
             
-            result.append({
-                **item,
-                "matches_user_input": matches
-            })
+        Returns:
+            Weight to add to the exposure score
+        """
+        base_weight = self.RISK_WEIGHTS.get(risk_level, 5)
         
-        return result
+        # Increase weight for items that match user input
+        if matches_user_input:
+            base_weight = int(base_weight * 1.5)
+        
+        # Increase weight for items exposed on multiple platforms
+        if platform_count > 1:
+            base_weight += (platform_count - 1) * 3
+        
+        return base_weight
     
     def _calculate_exposure_score(self, exposed_pii: List[Dict]) -> int:
         """
@@ -377,30 +589,7 @@ class PIIExposureAnalyzer:
         Returns:
             Exposure score from 0 (low) to 100 (high)
         """
-        if not exposed_pii:
-            return 0
-        
-        total_weight = 0
-        
-        for item in exposed_pii:
-            risk_level = item.get("risk_level", "low")
-            base_weight = self.RISK_WEIGHTS.get(risk_level, 5)
-            
-            # Increase weight for items that match user input
-            if item.get("matches_user_input", False):
-                base_weight = int(base_weight * 1.5)
-            
-            # Increase weight for items exposed on multiple platforms
-            platform_count = item.get("platform_count", 1)
-            if platform_count > 1:
-                base_weight += (platform_count - 1) * 3
-            
-            total_weight += base_weight
-        
-        # Normalize to 0-100 scale (cap at 100)
-        score = min(total_weight, 100)
-        
-        return score
+        return self._match_and_score(exposed_pii)
     
     def _determine_risk_level(self, score: int) -> str:
         """
@@ -438,15 +627,21 @@ class PIIExposureAnalyzer:
         """
         breakdown = {}
         
+        # Index items by platform in one pass instead of rescanning the
+        # whole PII list for every platform
+        items_by_platform: Dict[str, List[Dict]] = {platform: [] for platform in platform_data}
+        for item in exposed_pii:
+            for platform in item.get("platforms", []):
+                platform_items = items_by_platform.get(platform)
+                if platform_items is not None:
+                    platform_items.append(item)
+        
         for platform, data in platform_data.items():
             status = data.get("status", "unknown")
             url = data.get("url", "")
             
             # Get items exposed on this platform
-            platform_items = [
-                item for item in exposed_pii
-                if platform in item.get("platforms", [])
-            ]
+            platform_items = items_by_platform[platform]
             
             breakdown[platform] = {
                 "platform": platform,
@@ -475,14 +670,13 @@ class PIIExposureAnalyzer:
         """
         recommendations = []
         
-        # Find critical and high risk items
-        critical_items = [item for item in exposed_pii if item.get("risk_level") == "critical"]
-        high_items = [item for item in exposed_pii if item.get("risk_level") == "high"]
-        matched_items = [item for item in exposed_pii if item.get("matches_user_input", False)]
+        # Group items by PII type in a single pass
+        items_by_type: Dict[str, List[Dict]] = defaultdict(list)
+        for item in exposed_pii:
+            items_by_type[item.get("type")].append(item)
         
         # Phone exposure recommendations
-        phone_items = [item for item in exposed_pii if item.get("type") == "phone"]
-        for item in phone_items:
+        for item in items_by_type["phone"]:
             platforms = ", ".join(item.get("platforms", []))
             recommendations.append(
                 f"⚠️ CRITICAL: Your phone number ({item['value']}) is publicly visible on {platforms}. "
@@ -490,8 +684,7 @@ class PIIExposureAnalyzer:
             )
         
         # Email exposure recommendations
-        email_items = [item for item in exposed_pii if item.get("type") == "email"]
-        for item in email_items:
+        for item in items_by_type["email"]:
             platform_count = item.get("platform_count", 1)
             if platform_count > 1:
                 recommendations.append(
@@ -506,8 +699,7 @@ class PIIExposureAnalyzer:
                 )
         
         # Location exposure recommendations - show specific values
-        location_items = [item for item in exposed_pii if item.get("type") == "location"]
-        for item in location_items:
+        for item in items_by_type["location"]:
             platforms = ", ".join(item.get("platforms", []))
             location_value = item.get("value", "")[:50]  # Truncate long values
             recommendations.append(
@@ -516,8 +708,7 @@ class PIIExposureAnalyzer:
             )
         
         # Workplace exposure recommendations - show specific values
-        workplace_items = [item for item in exposed_pii if item.get("type") == "workplace"]
-        for item in workplace_items:
+        for item in items_by_type["workplace"]:
             platforms = ", ".join(item.get("platforms", []))
             workplace_value = item.get("value", "")[:50]  # Truncate long values
             recommendations.append(
@@ -572,29 +763,27 @@ class PIIExposureAnalyzer:
         if not text:
             return pii
         
-        # Email pattern
-        emails = re.findall(
-            r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
-            text
-        )
-        pii["emails"] = list(set(emails))
-        
-        # Sri Lankan phone patterns
-        # Matches: +94 77 123 4567, 0771234567, 077-123-4567, etc.
-        phones = re.findall(
-            r'(?:\+94|0)?[0-9]{2}[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
-            text
-        )
-        pii["phones"] = list(set(phones))
+        # Bound the scan for oversized (or adversarial) input
+        if len(text) > self.MAX_PII_TEXT_LENGTH:
+            text = text[:self.MAX_PII_TEXT_LENGTH]
         
-        # URLs
-        urls = re.findall(
-            r'https?://[^\s<>"{}|\\^`\[\]]+',
-            text
-        )
-        pii["urls"] = list(set(urls))
+        # Every pattern needs an "@", "http" or a digit; most bios have
+        # none of them, and these checks run in C without the regex engine
+        if "@" not in text and "http" not in text and not _DIGIT_RE.search(text):
+            return pii
         
-        return pii
+        # Single pass over the text; dicts dedupe as matches come in while
+        # keeping first-seen order
+        found: Dict[str, Dict[str, None]] = {key: {} for key in pii}
+        emails = found["emails"]
+        for match in _PII_RE.finditer(text):
+            value = match.group()
+            found[match.lastgroup][value] = None
+            if match.lastgroup == "urls" and "@" in value:
+                for email in _EMAIL_RE.findall(value):
+                    emails[email] = None
+        
+        return {key: list(values) for key, values in found.items()}
     
     def _normalize_phone(self, phone: str) -> str:
         """
@@ -606,23 +795,7 @@ class PIIExposureAnalyzer:
         Returns:
             Normalized phone number (digits only, with country code)
         """
-        if not phone:
-            return ""
-        
-        # Remove all non-digit characters except +
-        cleaned = re.sub(r'[^\d+]', '', phone)
-        
-        # Convert to standard format
-        if cleaned.startswith('+94'):
-            return cleaned
-        elif cleaned.startswith('0094'):
-            return '+94' + cleaned[4:]
-        elif cleaned.startswith('94') and len(cleaned) >= 11:
-            return '+' + cleaned
-        elif cleaned.startswith('0') and len(cleaned) >= 10:
-            return '+94' + cleaned[1:]
-        
-        return cleaned
+        return _normalize_phone(phone)
 
 
 # =============================================================================
@@ -29,14 +29,198 @@ Example Usage:
     # Returns results with Sri Lankan phone format variations
 """
 
+import asyncio
+import functools
+import html
+import random
 import re
-from typing import Dict, List, Optional, Any
-from urllib.parse import quote_plus
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from urllib.parse import quote_plus, unquote_plus
 import logging
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# -----------------------------------------------------------------------------
+# Precompiled patterns
+# -----------------------------------------------------------------------------
+
+# Email format validation
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Whitespace, dashes and parentheses stripped from phone input. ASCII input
+# is cleaned with a translate table; the regex covers Unicode whitespace.
+_PHONE_STRIP_RE = re.compile(r'[\s\-\(\)]')
+_PHONE_STRIP_TRANS = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if chr(c).isspace()) + '-()'
+)
+
+# Everything except lowercase letters and digits
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
+# Result links on a Google results page: either a "/url?...q=<target>"
+# redirect or a direct absolute URL
+_RESULT_HREF_RE = re.compile(
+    r'href="(?:/url\?(?:[^"]*?&(?:amp;)?)?q=([^"&]+)|(https?://[^"]+)")'
+)
+
+# -----------------------------------------------------------------------------
+# Query-string encoding
+# -----------------------------------------------------------------------------
+
+# ASCII translation table equivalent to quote_plus(): unreserved characters
+# pass through, space becomes '+', everything else is percent-encoded
+_UNRESERVED = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~"
+)
+_QUERY_QUOTE_TABLE = {
+    code: (chr(code) if chr(code) in _UNRESERVED
+           else "+" if code == 0x20
+           else "%{:02X}".format(code))
+    for code in range(128)
+}
+
+
+def _quote_query(query: str) -> str:
+    """
+    Encode a dork query for use in a Google search URL.
+    
+    ASCII queries (the common case) go through a single str.translate call;
+    anything else falls back to quote_plus for correct UTF-8 encoding.
+    
+    Args:
+        query: Dork query string
+        
+    Returns:
+        str: Query encoded exactly as quote_plus would
+    """
+    if query.isascii():
+        return query.translate(_QUERY_QUOTE_TABLE)
+    return quote_plus(query)
+
+
+# Sri Lankan mobile formats keyed by digit count (after stripping '+'):
+# (required prefix, digits to drop before prefixing the local '0')
+_MOBILE_FORMATS_BY_LENGTH = {
+    10: ('07', 1),       # 07XXXXXXXX
+    11: ('947', 2),      # 947XXXXXXXX / +947XXXXXXXX
+    13: ('00947', 4),    # 00947XXXXXXXX
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _phone_variations(cleaned_phone: str) -> Tuple[str, ...]:
+    """
+    Generate Sri Lankan phone number format variations (cached).
+    
+    Args:
+        cleaned_phone: Phone number with only digits and +
+    
+    Returns:
+        Tuple of phone format variations in a fixed order, local format first
+    """
+    variations = []
+    
+    # Remove leading + for processing
+    digits_only = cleaned_phone.lstrip('+')
+    
+    # Determine base number (local 07XXXXXXXX form). Each mobile format has
+    # a distinct length, so one lookup picks the only prefix to check.
+    base_number = None
+    
+    mobile_format = _MOBILE_FORMATS_BY_LENGTH.get(len(digits_only))
+    if mobile_format is not None:
+        prefix, country_digits = mobile_format
+        if digits_only.startswith(prefix):
+            base_number = '0' + digits_only[country_digits:]
+    
+    if not base_number:
+        # Not a valid Sri Lankan mobile format
+        # Return original if it looks like a phone number
+        if len(digits_only) >= 7:
+            return (cleaned_phone,)
+        return ()
+    
+    # Generate variations from base_number (e.g., "0771234567")
+    # Local format: 0771234567
+    variations.append(base_number)
+    
+    # International with +: +94771234567
+    intl = "+94" + base_number[1:]
+    variations.append(intl)
+    
+    # International without +: 94771234567
+    variations.append("94" + base_number[1:])
+    
+    # Formatted local: 077-123-4567
+    formatted = f"{base_number[:3]}-{base_number[3:6]}-{base_number[6:]}"
+    variations.append(formatted)
+    
+    # Formatted with spaces: 077 123 4567
+    spaced = f"{base_number[:3]} {base_number[3:6]} {base_number[6:]}"
+    variations.append(spaced)
+    
+    # International formatted: +94 77 123 4567
+    intl_formatted = f"+94 {base_number[1:3]} {base_number[3:6]} {base_number[6:]}"
+    variations.append(intl_formatted)
+    
+    # The six formats are always distinct, so no dedup pass is needed
+    return tuple(variations)
+
+
+@dataclass(slots=True, frozen=True)
+class _DorkResult:
+    """Compact, immutable search result held in the per-instance caches."""
+    platform: str
+    platform_id: str
+    query: str
+    search_url: str
+    search_type: str
+    identifier: str
+    is_variation: Optional[bool] = None
+    original_username: Optional[str] = None
+    original_phone: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Materialize the public result dictionary.
+        
+        Username- and phone-only fields are included only when set, so each
+        search type keeps its original set of keys.
+        
+        Returns:
+            Dict[str, Any]: Fresh result dictionary with empty potential_profiles
+        """
+        result = {
+            "platform": self.platform,
+            "platform_id": self.platform_id,
+            "query": self.query,
+            "search_url": self.search_url,
+            "search_type": self.search_type,
+            "identifier": self.identifier,
+        }
+        if self.is_variation is not None:
+            result["is_variation"] = self.is_variation
+            result["original_username"] = self.original_username
+        if self.original_phone is not None:
+            result["original_phone"] = self.original_phone
+        result["potential_profiles"] = []  # To be populated by actual search
+        return result
+
 
 class GoogleDorkSearcher:
     """
@@ -136,13 +320,89 @@ class GoogleDorkSearcher:
         "Chrome/131.0.0.0 Safari/537.36"
     )
     REQUEST_TIMEOUT = 15.0
+    FETCH_CONCURRENCY = 4
+    
+    # Results pages all come from google.com: request starts are spaced
+    # this far apart, and 429/503 or transport errors are retried with
+    # exponential backoff and jitter (mirrors LightScanService)
+    DELAY_BETWEEN_REQUESTS = 1.0  # seconds
+    MAX_RETRIES = 3
+    RETRY_STATUS_CODES = frozenset([429, 503])
+    RETRY_BASE_DELAY = 1.0  # seconds
+    
+    # Compiled once when the class is defined and shared by all instances
+    # (non-profile patterns fused into one alternation: a single regex
+    # search per URL instead of one per pattern)
+    _non_profile_re = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in NON_PROFILE_PATTERNS),
+        re.IGNORECASE
+    )
+    _compiled_profile_patterns = {
+        platform_id: re.compile(config["profile_pattern"])
+        for platform_id, config in PLATFORM_DORKS.items()
+    }
+    
+    # Plain-string equivalents of the profile patterns above: the username
+    # is the last path segment (one trailing '/' allowed), the text before
+    # it must end with one of the site suffixes, and the segment may only
+    # contain the allowed characters. Platforms missing here use the regex.
+    _USERNAME_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    _PROFILE_URL_SPECS = {
+        "facebook": (("facebook.com",), _USERNAME_CHARS + "._"),
+        "instagram": (("instagram.com",), _USERNAME_CHARS + "._"),
+        "linkedin": (("linkedin.com/in",), _USERNAME_CHARS + "-"),
+        "x": (("x.com", "twitter.com"), _USERNAME_CHARS + "_"),
+    }
+    
+    # Per-platform specs materialized once as (platform_id, name,
+    # template_parts, username_parts). Templates are pre-split around their
+    # placeholder, so building a query is value.join(parts) rather than
+    # parsing a format string (the X username template uses its
+    # placeholder twice).
+    _platform_specs = tuple(
+        (
+            platform_id,
+            config["name"],
+            tuple(config["dork_template"].split("{query}")),
+            tuple(config["dork_username"].split("{username}")),
+        )
+        for platform_id, config in PLATFORM_DORKS.items()
+    )
+    _google_search_prefix = GOOGLE_SEARCH_URL.partition("{query}")[0]
+    
+    # "site:..." terms for combined dork queries, with the all-platforms
+    # default joined once
+    _site_terms = {
+        platform_id: f"site:{config['site']}"
+        for platform_id, config in PLATFORM_DORKS.items()
+    }
+    _all_sites_query = " OR ".join(_site_terms.values())
+    
+    # Search results are a pure function of the normalized identifier
+    SEARCH_CACHE_MAX_SIZE = 1024
+    
+    # Per-instance result caches plus the request pacing state
+    __slots__ = (
+        "_search_by_name_cached",
+        "_search_by_email_cached",
+        "_search_by_username_cached",
+        "_search_by_phone_cached",
+        "_rate_limit_lock",
+        "_next_request_at",
+    )
     
     def __init__(self):
         """Initialize the Google Dork Searcher."""
-        self._compiled_non_profile_patterns = [
-            re.compile(pattern, re.IGNORECASE) 
-            for pattern in self.NON_PROFILE_PATTERNS
-        ]
+        # Per-instance LRU caches over the result builders
+        cache = functools.lru_cache(maxsize=self.SEARCH_CACHE_MAX_SIZE)
+        self._search_by_name_cached = cache(self._build_name_results)
+        self._search_by_email_cached = cache(self._build_email_results)
+        self._search_by_username_cached = cache(self._build_username_results)
+        self._search_by_phone_cached = cache(self._build_phone_results)
+        
+        # Rate limiter state (lock is created lazily inside a running loop)
+        self._rate_limit_lock: Optional[asyncio.Lock] = None
+        self._next_request_at = 0.0
     
     # -------------------------------------------------------------------------
     # PUBLIC SEARCH METHODS
@@ -182,32 +442,7 @@ class GoogleDorkSearcher:
                 ...
             ]
         """
-        if not name or not name.strip():
-            return []
-        
-        name = name.strip()
-        results = []
-        
-        for platform_id, config in self.PLATFORM_DORKS.items():
-            # Build query with location if provided
-            if location:
-                query = f'{config["dork_template"].format(query=name)} "{location}"'
-            else:
-                query = config["dork_template"].format(query=name)
-            
-            search_url = self.GOOGLE_SEARCH_URL.format(query=quote_plus(query))
-            
-            results.append({
-                "platform": config["name"],
-                "platform_id": platform_id,
-                "query": query,
-                "search_url": search_url,
-                "search_type": "name",
-                "identifier": name,
-                "potential_profiles": []  # To be populated by actual search
-            })
-        
-        return results
+        return list(self.iter_search_by_name(name, location))
     
     def search_by_email(self, email: str) -> List[Dict[str, Any]]:
         """
@@ -226,55 +461,7 @@ class GoogleDorkSearcher:
             >>> searcher.search_by_email("john.perera@gmail.com")
             # Searches for "john.perera@gmail.com" and "john.perera"
         """
-        if not email or not email.strip():
-            return []
-        
-        email = email.strip().lower()
-        
-        # Validate email format
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
-            return []
-        
-        # Extract username from email
-        username = email.split('@')[0]
-        
-        results = []
-        
-        for platform_id, config in self.PLATFORM_DORKS.items():
-            # Search with full email
-            email_query = config["dork_template"].format(query=email)
-            email_search_url = self.GOOGLE_SEARCH_URL.format(
-                query=quote_plus(email_query)
-            )
-            
-            results.append({
-                "platform": config["name"],
-                "platform_id": platform_id,
-                "query": email_query,
-                "search_url": email_search_url,
-                "search_type": "email",
-                "identifier": email,
-                "potential_profiles": []
-            })
-            
-            # Search with extracted username
-            username_query = config["dork_username"].format(username=username)
-            username_search_url = self.GOOGLE_SEARCH_URL.format(
-                query=quote_plus(username_query)
-            )
-            
-            results.append({
-                "platform": config["name"],
-                "platform_id": platform_id,
-                "query": username_query,
-                "search_url": username_search_url,
-                "search_type": "email_username",
-                "identifier": username,
-                "potential_profiles": []
-            })
-        
-        return results
+        return list(self.iter_search_by_email(email))
     
     def search_by_username(self, username: str) -> List[Dict[str, Any]]:
         """
@@ -293,36 +480,7 @@ class GoogleDorkSearcher:
             >>> searcher.search_by_username("john_doe")
             # Searches for "john_doe", "johndoe", "john.doe" variations
         """
-        if not username or not username.strip():
-            return []
-        
-        username = username.strip().lstrip('@')
-        
-        # Generate username variations
-        variations = self._generate_username_variations(username)
-        
-        results = []
-        
-        for variation in variations:
-            for platform_id, config in self.PLATFORM_DORKS.items():
-                query = config["dork_username"].format(username=variation)
-                search_url = self.GOOGLE_SEARCH_URL.format(
-                    query=quote_plus(query)
-                )
-                
-                results.append({
-                    "platform": config["name"],
-                    "platform_id": platform_id,
-                    "query": query,
-                    "search_url": search_url,
-                    "search_type": "username",
-                    "identifier": variation,
-                    "is_variation": variation != username.lower(),
-                    "original_username": username,
-                    "potential_profiles": []
-                })
-        
-        return results
+        return list(self.iter_search_by_username(username))
     
     def search_by_phone(self, phone: str) -> List[Dict[str, Any]]:
         """
@@ -344,40 +502,405 @@ class GoogleDorkSearcher:
             >>> searcher.search_by_phone("0771234567")
             # Searches for "0771234567", "+94771234567", "077-123-4567", etc.
         """
+        return list(self.iter_search_by_phone(phone))
+    
+    # -------------------------------------------------------------------------
+    # LAZY SEARCH ITERATORS
+    # -------------------------------------------------------------------------
+    
+    def iter_search_by_name(
+        self,
+        name: str,
+        location: Optional[str] = "Sri Lanka"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield name search results (see search_by_name).
+        
+        Args:
+            name: Full name to search for
+            location: Optional location filter (default: "Sri Lanka")
+        
+        Yields:
+            Fresh search result dictionaries, one at a time
+        """
+        if not name or not name.strip():
+            return
+        
+        name = name.strip()
+        
+        yield from self._iter_results(self._search_by_name_cached(name, location))
+    
+    def iter_search_by_email(self, email: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield email search results (see search_by_email).
+        
+        Args:
+            email: Email address to search
+        
+        Yields:
+            Fresh search result dictionaries, one at a time
+        """
+        if not email or not email.strip():
+            return
+        
+        email = email.strip().lower()
+        
+        yield from self._iter_results(self._search_by_email_cached(email))
+    
+    def iter_search_by_username(self, username: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield username search results (see search_by_username).
+        
+        Args:
+            username: Username to search for
+        
+        Yields:
+            Fresh search result dictionaries, one at a time
+        """
+        if not username or not username.strip():
+            return
+        
+        username = username.strip().lstrip('@')
+        
+        yield from self._iter_results(self._search_by_username_cached(username))
+    
+    def iter_search_by_phone(self, phone: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield phone search results (see search_by_phone).
+        
+        Args:
+            phone: Sri Lankan phone number in any format
+        
+        Yields:
+            Fresh search result dictionaries, one at a time
+        """
         if not phone or not phone.strip():
-            return []
+            return
         
-        # Clean phone number
         phone = phone.strip()
-        cleaned = re.sub(r'[\s\-\(\)]', '', phone)
+        
+        yield from self._iter_results(self._search_by_phone_cached(phone))
+    
+    # -------------------------------------------------------------------------
+    # RESULT CACHING
+    # -------------------------------------------------------------------------
+    
+    @staticmethod
+    def _iter_results(cached: Tuple[_DorkResult, ...]) -> Iterator[Dict[str, Any]]:
+        """
+        Materialize cached search results as fresh dictionaries on demand.
+        
+        Args:
+            cached: Cached result tuple
+        
+        Returns:
+            Iterator of fresh result dictionaries
+        """
+        return map(_DorkResult.to_dict, cached)
+    
+    def _build_name_results(self, name: str, location: Optional[str]) -> Tuple[_DorkResult, ...]:
+        """
+        Build name search results (cached per instance; see search_by_name).
+        
+        Args:
+            name: Stripped name
+            location: Optional location filter
+        
+        Returns:
+            Tuple of cached search results
+        """
+        results = []
+        
+        for platform_id, platform_name, template_parts, username_parts in self._platform_specs:
+            # Build query with location if provided
+            if location:
+                query = f'{name.join(template_parts)} "{location}"'
+            else:
+                query = name.join(template_parts)
+            
+            search_url = self._google_search_prefix + _quote_query(query)
+            
+            results.append(_DorkResult(
+                platform=platform_name,
+                platform_id=platform_id,
+                query=query,
+                search_url=search_url,
+                search_type="name",
+                identifier=name
+            ))
+        
+        return tuple(results)
+    
+    def _build_email_results(self, email: str) -> Tuple[_DorkResult, ...]:
+        """
+        Build email search results (cached per instance; see search_by_email).
+        
+        Args:
+            email: Stripped, lowercased email
+        
+        Returns:
+            Tuple of cached search results
+        """
+        # Validate email format
+        if not _EMAIL_RE.match(email):
+            return ()
+        
+        # Extract username from email
+        username = email.partition('@')[0]
+        
+        results = []
+        
+        for platform_id, platform_name, template_parts, username_parts in self._platform_specs:
+            # Search with full email
+            email_query = email.join(template_parts)
+            email_search_url = self._google_search_prefix + _quote_query(email_query)
+            
+            results.append(_DorkResult(
+                platform=platform_name,
+                platform_id=platform_id,
+                query=email_query,
+                search_url=email_search_url,
+                search_type="email",
+                identifier=email
+            ))
+            
+            # Search with extracted username
+            username_query = username.join(username_parts)
+            username_search_url = self._google_search_prefix + _quote_query(username_query)
+            
+            results.append(_DorkResult(
+                platform=platform_name,
+                platform_id=platform_id,
+                query=username_query,
+                search_url=username_search_url,
+                search_type="email_username",
+                identifier=username
+            ))
+        
+        return tuple(results)
+    
+    def _build_username_results(self, username: str) -> Tuple[_DorkResult, ...]:
+        """
+        Build username search results (cached per instance; see search_by_username).
+        
+        Args:
+            username: Username without surrounding whitespace or '@'
+        
+        Returns:
+            Tuple of cached search results
+        """
+        # Generate username variations
+        variations = self._generate_username_variations(username)
+        
+        results = []
+        
+        for variation in variations:
+            for platform_id, platform_name, template_parts, username_parts in self._platform_specs:
+                query = variation.join(username_parts)
+                search_url = self._google_search_prefix + _quote_query(query)
+                
+                results.append(_DorkResult(
+                    platform=platform_name,
+                    platform_id=platform_id,
+                    query=query,
+                    search_url=search_url,
+                    search_type="username",
+                    identifier=variation,
+                    is_variation=variation != username.lower(),
+                    original_username=username
+                ))
+        
+        return tuple(results)
+    
+    def _build_phone_results(self, phone: str) -> Tuple[_DorkResult, ...]:
+        """
+        Build phone search results (cached per instance; see search_by_phone).
+        
+        Args:
+            phone: Stripped phone number
+        
+        Returns:
+            Tuple of cached search results
+        """
+        # Strip formatting characters
+        if phone.isascii():
+            cleaned = phone.translate(_PHONE_STRIP_TRANS)
+        else:
+            cleaned = _PHONE_STRIP_RE.sub('', phone)
         
         # Generate phone format variations
-        phone_variations = self._generate_phone_variations(cleaned)
+        phone_variations = _phone_variations(cleaned)
         
         if not phone_variations:
-            return []
+            return ()
         
         results = []
         
         for phone_format in phone_variations:
-            for platform_id, config in self.PLATFORM_DORKS.items():
-                query = config["dork_template"].format(query=phone_format)
-                search_url = self.GOOGLE_SEARCH_URL.format(
-                    query=quote_plus(query)
-                )
+            for platform_id, platform_name, template_parts, username_parts in self._platform_specs:
+                query = phone_format.join(template_parts)
+                search_url = self._google_search_prefix + _quote_query(query)
                 
-                results.append({
-                    "platform": config["name"],
-                    "platform_id": platform_id,
-                    "query": query,
-                    "search_url": search_url,
-                    "search_type": "phone",
-                    "identifier": phone_format,
-                    "original_phone": phone,
-                    "potential_profiles": []
-                })
-        
-        return results
+                results.append(_DorkResult(
+                    platform=platform_name,
+                    platform_id=platform_id,
+                    query=query,
+                    search_url=search_url,
+                    search_type="phone",
+                    identifier=phone_format,
+                    original_phone=phone
+                ))
+        
+        return tuple(results)
+    
+    # -------------------------------------------------------------------------
+    # RESULT FETCHING
+    # -------------------------------------------------------------------------
+    
+    async def fetch_all(
+        self,
+        results: List[Dict[str, Any]],
+        concurrency: int = FETCH_CONCURRENCY,
+        client: Optional["httpx.AsyncClient"] = None
+    ) -> None:
+        """
+        Fetch the search page for each result and fill potential_profiles.
+        
+        All URLs go through one AsyncClient (HTTP/2 when available), so
+        requests share pooled connections instead of a TLS handshake each,
+        with at most `concurrency` requests in flight. Request starts are
+        paced DELAY_BETWEEN_REQUESTS apart and throttled responses are
+        retried (see _get_with_retry). Failed fetches leave the result's
+        potential_profiles untouched.
+        
+        Args:
+            results: Search results from search_by_*; updated in place
+            concurrency: Maximum number of concurrent requests
+            client: Optional existing client to reuse
+        """
+        if not results or not HTTPX_AVAILABLE:
+            return
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_one(http_client: "httpx.AsyncClient", result: Dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    response = await self._get_with_retry(http_client, result["search_url"])
+                except httpx.HTTPError as e:
+                    logger.debug("Dork fetch failed for %s: %s", result["search_url"], e)
+                    return
+            
+            if response.status_code != 200:
+                logger.debug("Dork fetch returned %s for %s", response.status_code, result["search_url"])
+                return
+            
+            result["potential_profiles"] = self._extract_profile_urls(
+                response.text, result["platform_id"]
+            )
+        
+        if client is not None:
+            await asyncio.gather(*(fetch_one(client, result) for result in results))
+            return
+        
+        async with httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=self.REQUEST_TIMEOUT,
+            headers={"User-Agent": self.DEFAULT_USER_AGENT},
+            follow_redirects=True
+        ) as new_client:
+            await asyncio.gather(*(fetch_one(new_client, result) for result in results))
+    
+    async def _acquire_request_slot(self) -> None:
+        """
+        Wait until the next Google request is allowed to start.
+        
+        Requests are spaced DELAY_BETWEEN_REQUESTS apart measured from the
+        start of the previous request, so time spent waiting on a slow
+        response counts towards the delay.
+        """
+        if self._rate_limit_lock is None:
+            self._rate_limit_lock = asyncio.Lock()
+        
+        async with self._rate_limit_lock:
+            wait = self._next_request_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_request_at = time.monotonic() + self.DELAY_BETWEEN_REQUESTS
+    
+    async def _get_with_retry(
+        self,
+        client: "httpx.AsyncClient",
+        url: str
+    ) -> "httpx.Response":
+        """
+        Issue a paced GET, retrying transient failures.
+        
+        Responses with a status in RETRY_STATUS_CODES and httpx transport
+        errors are retried up to MAX_RETRIES attempts with exponential
+        backoff and jitter. The last response is returned (or the last
+        transport error re-raised) once attempts are exhausted.
+        
+        Args:
+            client: httpx AsyncClient
+            url: Request URL
+        
+        Returns:
+            httpx.Response: The final response
+        """
+        for attempt in range(self.MAX_RETRIES):
+            await self._acquire_request_slot()
+            try:
+                response = await client.get(url)
+            except httpx.TransportError as e:
+                if attempt == self.MAX_RETRIES - 1:
+                    raise
+                logger.debug("Transport error on attempt %d: %s", attempt + 1, e)
+            else:
+                if (response.status_code not in self.RETRY_STATUS_CODES
+                        or attempt == self.MAX_RETRIES - 1):
+                    return response
+                logger.debug(
+                    "Google returned %s on attempt %d, retrying",
+                    response.status_code, attempt + 1
+                )
+            
+            delay = self.RETRY_BASE_DELAY * (2 ** attempt)
+            await asyncio.sleep(delay * random.uniform(0.75, 1.25))
+        
+        # Unreachable: the final attempt always returns or raises
+        raise RuntimeError("retry loop exited without a response")
+    
+    def _extract_profile_urls(self, page: str, platform_id: str) -> List[str]:
+        """
+        Extract unique profile URLs for a platform from a results page.
+        
+        Args:
+            page: Google results page HTML
+            platform_id: Platform identifier
+        
+        Returns:
+            List of profile URLs in page order
+        """
+        profiles = []
+        seen = set()
+        
+        for match in _RESULT_HREF_RE.finditer(page):
+            redirect_target, direct_url = match.groups()
+            if redirect_target is not None:
+                url = unquote_plus(html.unescape(redirect_target))
+            else:
+                url = html.unescape(direct_url)
+            
+            if url in seen:
+                continue
+            seen.add(url)
+            
+            if (self._non_profile_re.search(url) is None
+                    and self.extract_username_from_url(url, platform_id)):
+                profiles.append(url)
+        
+        return profiles
     
     # -------------------------------------------------------------------------
     # URL FILTERING AND VALIDATION
@@ -399,14 +922,8 @@ class GoogleDorkSearcher:
         if not url:
             return False
         
-        url_lower = url.lower()
-        
-        # Check against non-profile patterns
-        for pattern in self._compiled_non_profile_patterns:
-            if pattern.search(url_lower):
-                return False
-        
-        return True
+        # Check against non-profile patterns (case-insensitive)
+        return self._non_profile_re.search(url) is None
     
     def extract_username_from_url(self, url: str, platform_id: str) -> Optional[str]:
         """
@@ -422,13 +939,24 @@ class GoogleDorkSearcher:
         if not url or platform_id not in self.PLATFORM_DORKS:
             return None
         
-        config = self.PLATFORM_DORKS[platform_id]
-        pattern = config.get("profile_pattern")
+        spec = self._PROFILE_URL_SPECS.get(platform_id)
+        if spec is not None:
+            site_suffixes, allowed_chars = spec
+            if url.endswith('/'):
+                url = url[:-1]
+            head, _, username = url.rpartition('/')
+            # strip() empties the segment only if every character is allowed
+            if (username and not username.strip(allowed_chars)
+                    and head.endswith(site_suffixes)):
+                return username
+            return None
+        
+        pattern = self._compiled_profile_patterns.get(platform_id)
         
         if not pattern:
             return None
         
-        match = re.search(pattern, url)
+        match = pattern.search(url)
         return match.group(1) if match else None
     
     def filter_profile_urls(
@@ -446,17 +974,24 @@ class GoogleDorkSearcher:
         Returns:
             List of filtered profile URL dictionaries
         """
+        # Loop-invariant lookups hoisted; the non-profile check is inlined
+        # from is_profile_url
+        platform_name = self.PLATFORM_DORKS[platform_id]["name"]
+        non_profile_search = self._non_profile_re.search
+        extract_username = self.extract_username_from_url
+        
         filtered = []
+        append = filtered.append
         
         for url in urls:
-            if self.is_profile_url(url):
-                username = self.extract_username_from_url(url, platform_id)
-                filtered.append({
-                    "url": url,
-                    "platform_id": platform_id,
-                    "platform": self.PLATFORM_DORKS[platform_id]["name"],
-                    "username": username
-                })
+            if not url or non_profile_search(url) is not None:
+                continue
+            append({
+                "url": url,
+                "platform_id": platform_id,
+                "platform": platform_name,
+                "username": extract_username(url, platform_id)
+            })
         
         return filtered
     
@@ -475,31 +1010,33 @@ class GoogleDorkSearcher:
             List of username variations
         """
         username = username.lower()
-        variations = set()
-        
-        # Original
-        variations.add(username)
-        
-        # Remove underscores
-        variations.add(username.replace('_', ''))
+        variations = []
+        seen = set()
         
-        # Remove dots
-        variations.add(username.replace('.', ''))
+        def add(variation: str) -> None:
+            if variation and variation not in seen:
+                seen.add(variation)
+                variations.append(variation)
         
-        # Replace underscores with dots
-        variations.add(username.replace('_', '.'))
+        # Original first, then only the rewrites that can change anything
+        add(username)
         
-        # Replace dots with underscores
-        variations.add(username.replace('.', '_'))
+        if '_' in username:
+            # Remove underscores / replace them with dots
+            add(username.replace('_', ''))
+            add(username.replace('_', '.'))
         
-        # Remove all special characters
-        clean = re.sub(r'[^a-z0-9]', '', username)
-        variations.add(clean)
+        if '.' in username:
+            # Remove dots / replace them with underscores
+            add(username.replace('.', ''))
+            add(username.replace('.', '_'))
         
-        # Filter out empty strings
-        variations.discard('')
+        # Remove all special characters (plain ASCII alphanumerics are
+        # already clean, so skip the regex for them)
+        if not (username.isascii() and username.isalnum()):
+            add(_NON_ALNUM_RE.sub('', username))
         
-        return list(variations)
+        return variations
     
     def _generate_phone_variations(self, cleaned_phone: str) -> List[str]:
         """
@@ -511,57 +1048,7 @@ class GoogleDorkSearcher:
         Returns:
             List of phone format variations
         """
-        variations = []
-        
-        # Remove leading + for processing
-        digits_only = cleaned_phone.lstrip('+')
-        
-        # Determine base number (last 9 digits for mobile)
-        base_number = None
-        
-        # Check if starts with 07 (local mobile)
-        if digits_only.startswith('07') and len(digits_only) == 10:
-            base_number = digits_only
-            
-        # Check if starts with 947 (international)
-        elif digits_only.startswith('947') and len(digits_only) == 11:
-            base_number = '0' + digits_only[2:]
-            
-        # Check if starts with 0094 (international with 00)
-        elif digits_only.startswith('00947') and len(digits_only) == 13:
-            base_number = '0' + digits_only[4:]
-        
-        if not base_number:
-            # Not a valid Sri Lankan mobile format
-            # Return original if it looks like a phone number
-            if len(digits_only) >= 7:
-                return [cleaned_phone]
-            return []
-        
-        # Generate variations from base_number (e.g., "0771234567")
-        # Local format: 0771234567
-        variations.append(base_number)
-        
-        # International with +: +94771234567
-        intl = "+94" + base_number[1:]
-        variations.append(intl)
-        
-        # International without +: 94771234567
-        variations.append("94" + base_number[1:])
-        
-        # Formatted local: 077-123-4567
-        formatted = f"{base_number[:3]}-{base_number[3:6]}-{base_number[6:]}"
-        variations.append(formatted)
-        
-        # Formatted with spaces: 077 123 4567
-        spaced = f"{base_number[:3]} {base_number[3:6]} {base_number[6:]}"
-        variations.append(spaced)
-        
-        # International formatted: +94 77 123 4567
-        intl_formatted = f"+94 {base_number[1:3]} {base_number[3:6]} {base_number[6:]}"
-        variations.append(intl_formatted)
-        
-        return list(set(variations))
+        return list(_phone_variations(cleaned_phone))
     
     def get_supported_platforms(self) -> List[str]:
         """
@@ -590,15 +1077,14 @@ class GoogleDorkSearcher:
             Combined dork query string
         """
         if platforms is None:
-            platforms = self.get_supported_platforms()
-        
-        site_parts = []
-        for platform_id in platforms:
-            if platform_id in self.PLATFORM_DORKS:
-                site = self.PLATFORM_DORKS[platform_id]["site"]
-                site_parts.append(f"site:{site}")
+            sites_query = self._all_sites_query
+        else:
+            sites_query = " OR ".join(
+                self._site_terms[platform_id]
+                for platform_id in platforms
+                if platform_id in self._site_terms
+            )
         
-        sites_query = " OR ".join(site_parts)
         return f'({sites_query}) "{identifier}"'
 
 
@@ -606,7 +1092,15 @@ class GoogleDorkSearcher:
 # MODULE-LEVEL CONVENIENCE FUNCTIONS
 # =============================================================================
 
-_default_searcher = GoogleDorkSearcher()
+_default_searcher: Optional[GoogleDorkSearcher] = None
+
+
+def get_default_searcher() -> GoogleDorkSearcher:
+    """Get or lazily create the module-level default searcher."""
+    global _default_searcher
+    if _default_searcher is None:
+        _default_searcher = GoogleDorkSearcher()
+    return _default_searcher
 
 
 def search_by_name(
@@ -614,19 +1108,19 @@ def search_by_name(
     location: Optional[str] = "Sri Lanka"
 ) -> List[Dict[str, Any]]:
     """Module-level convenience function for name search."""
-    return _default_searcher.search_by_name(name, location)
+    return get_default_searcher().search_by_name(name, location)
 
 
 def search_by_email(email: str) -> List[Dict[str, Any]]:
     """Module-level convenience function for email search."""
-    return _default_searcher.search_by_email(email)
+    return get_default_searcher().search_by_email(email)
 
 
 def search_by_username(username: str) -> List[Dict[str, Any]]:
     """Module-level convenience function for username search."""
-    return _default_searcher.search_by_username(username)
+    return get_default_searcher().search_by_username(username)
 
 
 def search_by_phone(phone: str) -> List[Dict[str, Any]]:
     """Module-level convenience function for phone search."""
-    return _default_searcher.search_by_phone(phone)
+    return get_default_searcher().search_by_phone(phone)
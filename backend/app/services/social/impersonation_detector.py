@@ -22,10 +22,61 @@ Example Usage:
     # Returns list of impersonation risks with indicators
 """
 
+import functools
 import re
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 
+# -----------------------------------------------------------------------------
+# Precompiled patterns
+# -----------------------------------------------------------------------------
+
+# Username segment of common social media profile URLs
+_URL_USERNAME_PATTERNS = (
+    re.compile(r'facebook\.com/([^/?]+)'),
+    re.compile(r'instagram\.com/([^/?]+)'),
+    re.compile(r'linkedin\.com/in/([^/?]+)'),
+    re.compile(r'x\.com/([^/?]+)'),
+    re.compile(r'twitter\.com/([^/?]+)'),
+)
+
+# Trailing run of digits in a username
+_TRAILING_DIGITS_RE = re.compile(r'(\d+)$')
+
+
+@functools.lru_cache(maxsize=1024)
+def _name_tokens(name: str) -> frozenset:
+    """
+    Lowercased whitespace-separated tokens of a name (cached).
+    
+    Args:
+        name: Name or username
+    
+    Returns:
+        frozenset: Unique lowercase tokens
+    """
+    return frozenset(name.lower().split())
+
+
+
+@dataclass(slots=True)
+class _Indicator:
+    """Impersonation indicator, kept as a slotted record until the response."""
+    type: str
+    severity: str
+    description: str
+    details: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the public indicator dictionary."""
+        return {
+            "type": self.type,
+            "severity": self.severity,
+            "description": self.description,
+            "details": self.details
+        }
+
 
 class ImpersonationDetector:
     """
@@ -51,6 +102,10 @@ class ImpersonationDetector:
         "iamthe", "imthe", "iam_"
     ]
     
+    # Tuple forms for single-call str.endswith / str.startswith checks
+    _suffix_tuple = tuple(SUSPICIOUS_SUFFIXES)
+    _prefix_tuple = tuple(SUSPICIOUS_PREFIXES)
+    
     # Suspicious bio content patterns (scam indicators)
     SUSPICIOUS_BIO_PATTERNS = [
         r"dm\s*(for|me)",
@@ -71,6 +126,23 @@ class ImpersonationDetector:
         r"financial\s*freedom"
     ]
     
+    # Compiled once when the class is defined and shared by all instances.
+    # The patterns are lowercase and bios are lowercased before matching,
+    # so no IGNORECASE case folding is needed.
+    _bio_patterns = tuple(
+        re.compile(pattern) for pattern in SUSPICIOUS_BIO_PATTERNS
+    )
+    _bio_scam_re = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in SUSPICIOUS_BIO_PATTERNS)
+    )
+    
+    # Literal words at least one of which every bio pattern requires; bios
+    # (already lowercased) containing none of them cannot match
+    _BIO_ANCHORS = (
+        "dm", "giveaway", "free", "click", "whatsapp", "investment", "money",
+        "guaranteed", "crypto", "forex", "rich", "limited", "act", "financial"
+    )
+    
     # Sri Lanka related location identifiers
     SRI_LANKA_INDICATORS = [
         "sri lanka", "srilanka", "sl", "lk",
@@ -79,6 +151,34 @@ class ImpersonationDetector:
         "batticaloa", "trincomalee", "anuradhapura"
     ]
     
+    # All indicators in one pass. Place names only need to start a word, so
+    # "Sri Lankan" and "Colombo07" still count; the two-letter codes ("sl",
+    # "lk") must be whole words so they don't match inside "Islamabad"
+    _sri_lanka_re = re.compile(
+        r"\b(?:"
+        + "|".join(
+            re.escape(indicator)
+            for indicator in sorted(SRI_LANKA_INDICATORS, key=len, reverse=True)
+            if len(indicator) > 2
+        )
+        + r")|\b(?:"
+        + "|".join(
+            re.escape(indicator)
+            for indicator in SRI_LANKA_INDICATORS
+            if len(indicator) <= 2
+        )
+        + r")\b"
+    )
+    
+    # Profile statuses that are analyzed, risk levels that are reported, and
+    # expected locations that enable the location mismatch check
+    FOUND_STATUSES = frozenset({"found", "exists"})
+    REPORTED_RISK_LEVELS = frozenset({"medium", "high"})
+    SRI_LANKA_EXPECTED = frozenset({"sri lanka", "lk"})
+    
+    # Slot per severity level for the single-pass count in _calculate_risk
+    _SEVERITY_INDEX = {"high": 0, "medium": 1, "low": 2}
+    
     # Report URLs for each platform
     REPORT_URLS = {
         "facebook": "https://www.facebook.com/help/contact/169486816475808",
@@ -118,11 +218,15 @@ class ImpersonationDetector:
         user_username = user_identifiers.get("username", "").lower().strip().lstrip('@')
         user_name = user_identifiers.get("name", "").lower().strip()
         
+        # Location mismatch only applies when Sri Lanka is expected; decided
+        # once per call rather than once per profile
+        check_location = expected_location.lower() in self.SRI_LANKA_EXPECTED
+        
         for platform, data in profile_data.items():
             status = data.get("status", "unknown")
             
             # Only check found profiles
-            if status not in ["found", "exists"]:
+            if status not in self.FOUND_STATUSES:
                 continue
             
             url = data.get("url", "")
@@ -135,7 +239,8 @@ class ImpersonationDetector:
                 scraped=scraped,
                 user_username=user_username,
                 user_name=user_name,
-                expected_location=expected_location
+                expected_location=expected_location,
+                check_location=check_location
             )
             
             if indicators:
@@ -143,7 +248,7 @@ class ImpersonationDetector:
                 risk_level, confidence = self._calculate_risk(indicators)
                 
                 # Only report medium or high risk profiles
-                if risk_level in ["medium", "high"]:
+                if risk_level in self.REPORTED_RISK_LEVELS:
                     risk_emoji = "🔴" if risk_level == "high" else "🟠"
                     
                     risks.append({
@@ -153,7 +258,7 @@ class ImpersonationDetector:
                         "risk_level": risk_level,
                         "risk_emoji": risk_emoji,
                         "confidence_score": confidence,
-                        "indicators": indicators,
+                        "indicators": [indicator.to_dict() for indicator in indicators],
                         "recommendation": self._generate_recommendation(risk_level, indicators),
                         "report_url": self.REPORT_URLS.get(platform, "")
                     })
@@ -170,8 +275,9 @@ class ImpersonationDetector:
         scraped: Dict,
         user_username: str,
         user_name: str,
-        expected_location: str
-    ) -> List[Dict[str, Any]]:
+        expected_location: str,
+        check_location: Optional[bool] = None
+    ) -> List["_Indicator"]:
         """
         Analyze a profile for impersonation indicators.
         
@@ -182,9 +288,11 @@ class ImpersonationDetector:
             user_username: User's expected username
             user_name: User's expected name
             expected_location: User's expected location
+            check_location: Whether to run the location mismatch check
+                (derived from expected_location when omitted)
             
         Returns:
-            List of indicator dictionaries
+            List of indicator records (converted to dicts by detect)
         """
         indicators = []
         
@@ -195,84 +303,91 @@ class ImpersonationDetector:
         # Extract username from URL
         profile_username = self._extract_username_from_url(url)
         
-        # Check 1: Suspicious username suffixes
-        for suffix in self.SUSPICIOUS_SUFFIXES:
-            if profile_username.endswith(suffix):
-                indicators.append({
-                    "type": "suspicious_suffix",
-                    "severity": "high",
-                    "description": f"Username ends with suspicious suffix '{suffix}'",
-                    "details": {
-                        "pattern": suffix,
-                        "username": profile_username
-                    }
-                })
-                break
-        
-        # Check 2: Suspicious username prefixes
-        for prefix in self.SUSPICIOUS_PREFIXES:
-            if profile_username.startswith(prefix):
-                indicators.append({
-                    "type": "suspicious_prefix",
-                    "severity": "medium",
-                    "description": f"Username starts with suspicious prefix '{prefix}'",
-                    "details": {
-                        "pattern": prefix,
-                        "username": profile_username
-                    }
-                })
-                break
+        # Check 1: Suspicious username suffixes (a single endswith over the
+        # whole tuple decides the check; the list is only walked on a hit to
+        # report the first configured suffix)
+        if profile_username.endswith(self._suffix_tuple):
+            suffix = next(
+                suffix for suffix in self.SUSPICIOUS_SUFFIXES
+                if profile_username.endswith(suffix)
+            )
+            indicators.append(_Indicator(
+                type="suspicious_suffix",
+                severity="high",
+                description=f"Username ends with suspicious suffix '{suffix}'",
+                details={
+                    "pattern": suffix,
+                    "username": profile_username
+                }
+            ))
+        
+        # Check 2: Suspicious username prefixes (same approach)
+        if profile_username.startswith(self._prefix_tuple):
+            prefix = next(
+                prefix for prefix in self.SUSPICIOUS_PREFIXES
+                if profile_username.startswith(prefix)
+            )
+            indicators.append(_Indicator(
+                type="suspicious_prefix",
+                severity="medium",
+                description=f"Username starts with suspicious prefix '{prefix}'",
+                details={
+                    "pattern": prefix,
+                    "username": profile_username
+                }
+            ))
         
         # Check 3: Duplicate username with numbers (if user provided username)
         if user_username:
-            number_pattern = re.search(r'(\d+)$', profile_username)
-            base_username = re.sub(r'\d+$', '', profile_username)
+            number_pattern = _TRAILING_DIGITS_RE.search(profile_username)
             
-            if number_pattern and base_username == user_username:
-                indicators.append({
-                    "type": "username_with_numbers",
-                    "severity": "high",
-                    "description": f"Username '{profile_username}' appears to be a copy with numbers added",
-                    "details": {
+            if number_pattern and profile_username[:number_pattern.start()] == user_username:
+                indicators.append(_Indicator(
+                    type="username_with_numbers",
+                    severity="high",
+                    description=f"Username '{profile_username}' appears to be a copy with numbers added",
+                    details={
                         "original": user_username,
                         "copy": profile_username,
                         "added_numbers": number_pattern.group(1)
                     }
-                })
+                ))
         
         # Check 4: Location mismatch (not in Sri Lanka when expected)
-        if profile_location and expected_location.lower() in ["sri lanka", "lk"]:
-            is_sri_lanka = any(
-                indicator in profile_location.lower()
-                for indicator in self.SRI_LANKA_INDICATORS
-            )
+        if check_location is None:
+            check_location = expected_location.lower() in self.SRI_LANKA_EXPECTED
+        
+        if profile_location and check_location:
+            is_sri_lanka = self._sri_lanka_re.search(profile_location) is not None
             
             if not is_sri_lanka and profile_location:
                 # Check if it mentions another country
-                indicators.append({
-                    "type": "location_mismatch",
-                    "severity": "medium",
-                    "description": f"Profile location '{profile_location}' differs from expected (Sri Lanka)",
-                    "details": {
+                indicators.append(_Indicator(
+                    type="location_mismatch",
+                    severity="medium",
+                    description=f"Profile location '{profile_location}' differs from expected (Sri Lanka)",
+                    details={
                         "profile_location": profile_location,
                         "expected_location": expected_location
                     }
-                })
-        
-        # Check 5: Suspicious bio content
-        if profile_bio:
-            for pattern in self.SUSPICIOUS_BIO_PATTERNS:
-                if re.search(pattern, profile_bio, re.IGNORECASE):
-                    indicators.append({
-                        "type": "suspicious_bio",
-                        "severity": "high",
-                        "description": "Bio contains suspicious content patterns (possible scam)",
-                        "details": {
-                            "matched_pattern": pattern,
-                            "bio_excerpt": profile_bio[:100] + "..." if len(profile_bio) > 100 else profile_bio
-                        }
-                    })
-                    break  # Only report once per profile
+                ))
+        
+        # Check 5: Suspicious bio content (a substring prefilter skips bios
+        # without any anchor word, then one combined scan decides the
+        # check; the first configured pattern that matches is reported)
+        if (profile_bio
+                and any(anchor in profile_bio for anchor in self._BIO_ANCHORS)
+                and self._bio_scam_re.search(profile_bio)):
+            pattern = next(p for p in self._bio_patterns if p.search(profile_bio))
+            indicators.append(_Indicator(
+                type="suspicious_bio",
+                severity="high",
+                description="Bio contains suspicious content patterns (possible scam)",
+                details={
+                    "matched_pattern": pattern.pattern,
+                    "bio_excerpt": profile_bio[:100] + "..." if len(profile_bio) > 100 else profile_bio
+                }
+            ))
         
         # Check 6: Similar name but different username
         if user_name and profile_name:
@@ -281,17 +396,17 @@ class ImpersonationDetector:
             username_similarity = self._calculate_name_similarity(user_username, profile_username) if user_username else 1.0
             
             if name_similarity > 0.8 and username_similarity < 0.5:
-                indicators.append({
-                    "type": "name_username_mismatch",
-                    "severity": "medium",
-                    "description": "Profile has similar name but different username (possible impersonator)",
-                    "details": {
+                indicators.append(_Indicator(
+                    type="name_username_mismatch",
+                    severity="medium",
+                    description="Profile has similar name but different username (possible impersonator)",
+                    details={
                         "user_name": user_name,
                         "profile_name": profile_name,
                         "user_username": user_username,
                         "profile_username": profile_username
                     }
-                })
+                ))
         
         return indicators
     
@@ -308,17 +423,8 @@ class ImpersonationDetector:
         if not url:
             return ""
         
-        # Common patterns for social media profile URLs
-        patterns = [
-            r'facebook\.com/([^/?]+)',
-            r'instagram\.com/([^/?]+)',
-            r'linkedin\.com/in/([^/?]+)',
-            r'x\.com/([^/?]+)',
-            r'twitter\.com/([^/?]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _URL_USERNAME_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1).lower().strip('/')
         
@@ -338,9 +444,10 @@ class ImpersonationDetector:
         if not name1 or not name2:
             return 0.0
         
-        # Normalize names
-        n1 = set(name1.lower().split())
-        n2 = set(name2.lower().split())
+        # Normalize names (token sets are cached, so the user's name is only
+        # split once across all platforms and scans)
+        n1 = _name_tokens(name1)
+        n2 = _name_tokens(name2)
         
         if not n1 or not n2:
             return 0.0
@@ -351,7 +458,7 @@ class ImpersonationDetector:
         
         return intersection / union if union > 0 else 0.0
     
-    def _calculate_risk(self, indicators: List[Dict]) -> tuple:
+    def _calculate_risk(self, indicators: List["_Indicator"]) -> tuple:
         """
         Calculate overall risk level from indicators.
         
@@ -364,10 +471,13 @@ class ImpersonationDetector:
         if not indicators:
             return ("low", 0.0)
         
-        # Count severity levels
-        high_count = sum(1 for i in indicators if i.get("severity") == "high")
-        medium_count = sum(1 for i in indicators if i.get("severity") == "medium")
-        low_count = sum(1 for i in indicators if i.get("severity") == "low")
+        # Count severity levels in one pass (last slot collects unknown
+        # severities, which do not contribute to the score)
+        counts = [0, 0, 0, 0]
+        severity_index = self._SEVERITY_INDEX
+        for indicator in indicators:
+            counts[severity_index.get(indicator.severity, 3)] += 1
+        high_count, medium_count, low_count, _ = counts
         
         # Calculate weighted score
         score = (high_count * 3) + (medium_count * 2) + (low_count * 1)
@@ -389,7 +499,7 @@ class ImpersonationDetector:
     def _generate_recommendation(
         self,
         risk_level: str,
-        indicators: List[Dict]
+        indicators: List["_Indicator"]
     ) -> str:
         """
         Generate recommendation based on risk level and indicators.
@@ -403,8 +513,8 @@ class ImpersonationDetector:
         """
         if risk_level == "high":
             # Check for specific high-severity indicators
-            has_scam_bio = any(i["type"] == "suspicious_bio" for i in indicators)
-            has_username_copy = any(i["type"] == "username_with_numbers" for i in indicators)
+            has_scam_bio = any(i.type == "suspicious_bio" for i in indicators)
+            has_username_copy = any(i.type == "username_with_numbers" for i in indicators)
             
             if has_scam_bio:
                 return (
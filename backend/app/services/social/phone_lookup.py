@@ -27,9 +27,40 @@ Example Usage:
     # }
 """
 
+import functools
 import re
 from typing import Dict, Optional, Any
 
+# Deletes every ASCII character except the digits 0-9 (str.translate table)
+_ASCII_NON_DIGITS = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if not '0' <= chr(c) <= '9')
+)
+
+
+def _classify_format(cleaned: str) -> Optional[str]:
+    """
+    Classify a cleaned local number with plain string checks.
+    
+    Mobile is 07[0-8] followed by 7 digits and is checked first; landline
+    is 0[1-9] followed by 7-8 digits. "Digit" means str.isdecimal(), the
+    same set the previous regex \\d matched.
+    
+    Args:
+        cleaned: Number with country code already replaced by a leading 0
+    
+    Returns:
+        str: "mobile", "landline", or None if neither format matches
+    """
+    length = len(cleaned)
+    if length < 9 or length > 10 or cleaned[0] != '0' or not cleaned.isdecimal():
+        return None
+    
+    if length == 10 and cleaned[1] == '7' and '0' <= cleaned[2] <= '8':
+        return "mobile"
+    if '1' <= cleaned[1] <= '9':
+        return "landline"
+    return None
+
 
 class PhoneNumberLookup:
     """
@@ -101,9 +132,15 @@ class PhoneNumberLookup:
         "091": "Galle"
     }
     
+    # Lookup results are a pure function of the input string
+    LOOKUP_CACHE_MAX_SIZE = 4096
+    
     def __init__(self):
         """Initialize the Phone Number Lookup service."""
-        pass
+        # Per-instance LRU cache over the lookup builder
+        self._lookup_cached = functools.lru_cache(
+            maxsize=self.LOOKUP_CACHE_MAX_SIZE
+        )(self._build_lookup)
     
     def _clean_number(self, phone: str) -> str:
         """
@@ -127,8 +164,12 @@ class PhoneNumberLookup:
         # Preserve + at the start
         has_plus = phone.strip().startswith('+')
         
-        # Remove all non-digit characters
-        cleaned = re.sub(r'[^\d]', '', phone)
+        # Remove all non-digit characters (translate for ASCII input;
+        # other input keeps the regex so Unicode digits behave as before)
+        if phone.isascii():
+            cleaned = phone.translate(_ASCII_NON_DIGITS)
+        else:
+            cleaned = re.sub(r'[^\d]', '', phone)
         
         # Add back + if it was there
         if has_plus:
@@ -171,8 +212,10 @@ class PhoneNumberLookup:
         elif cleaned.startswith('94') and len(cleaned) == 11:
             cleaned = '0' + cleaned[2:]
         
+        phone_format = _classify_format(cleaned)
+        
         # Check mobile format: 07XXXXXXXX (10 digits starting with 07)
-        if re.match(r'^07[0-8]\d{7}$', cleaned):
+        if phone_format == "mobile":
             prefix = cleaned[:3]
             if prefix in self.MOBILE_PREFIXES:
                 return {
@@ -191,25 +234,16 @@ class PhoneNumberLookup:
                 }
         
         # Check landline format: 0XXXXXXXX (9-10 digits starting with 0)
-        if re.match(r'^0[1-9]\d{7,8}$', cleaned):
-            prefix = cleaned[:3]
-            if prefix in self.LANDLINE_CODES:
-                return {
-                    "valid": True,
-                    "type": "landline",
-                    "prefix": prefix,
-                    "error": None,
-                    "normalized": cleaned
-                }
-            else:
-                # Could still be valid landline with unknown area code
-                return {
-                    "valid": True,
-                    "type": "landline",
-                    "prefix": prefix,
-                    "error": None,
-                    "normalized": cleaned
-                }
+        if phone_format == "landline":
+            # Valid whether or not the area code is known, so no
+            # LANDLINE_CODES lookup is needed here
+            return {
+                "valid": True,
+                "type": "landline",
+                "prefix": cleaned[:3],
+                "error": None,
+                "normalized": cleaned
+            }
         
         return {
             "valid": False,
@@ -234,8 +268,18 @@ class PhoneNumberLookup:
             >>> lookup._normalize_e164("0771234567")
             '+94771234567'
         """
-        validation = self._validate(phone)
+        return self._normalize_e164_from_validation(self._validate(phone))
+    
+    def _normalize_e164_from_validation(self, validation: Dict[str, Any]) -> Optional[str]:
+        """
+        Build the E.164 number from an existing _validate() result.
+        
+        Args:
+            validation: Result of _validate()
         
+        Returns:
+            str: E.164 formatted number or None if invalid
+        """
         if not validation.get("valid"):
             return None
         
@@ -259,8 +303,18 @@ class PhoneNumberLookup:
                 - carrier: Carrier name for mobile, region for landline
                 - prefix: The identified prefix
         """
-        validation = self._validate(phone)
+        return self._identify_carrier_from_validation(self._validate(phone))
+    
+    def _identify_carrier_from_validation(self, validation: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Identify the carrier/region from an existing _validate() result.
         
+        Args:
+            validation: Result of _validate()
+        
+        Returns:
+            Dict with carrier/region information (see _identify_carrier)
+        """
         if not validation.get("valid"):
             return {
                 "carrier": None,
@@ -322,6 +376,19 @@ class PhoneNumberLookup:
                 'error': None
             }
         """
+        # Results hold only scalars, so a shallow copy keeps the cache safe
+        return dict(self._lookup_cached(phone))
+    
+    def _build_lookup(self, phone: str) -> Dict[str, Any]:
+        """
+        Build a lookup result (cached per instance; see lookup).
+        
+        Args:
+            phone: Phone number in any format
+        
+        Returns:
+            Dict with the lookup fields described in lookup()
+        """
         result = {
             "original": phone,
             "valid": False,
@@ -347,15 +414,15 @@ class PhoneNumberLookup:
         result["valid"] = True
         result["type"] = validation.get("type")
         
-        # Identify carrier/region
-        carrier_info = self._identify_carrier(phone)
+        # Identify carrier/region (reusing the validation above)
+        carrier_info = self._identify_carrier_from_validation(validation)
         result["carrier"] = carrier_info.get("carrier")
         
         # Format numbers
         normalized = validation.get("normalized", "")
         
         # E.164 format
-        result["e164_format"] = self._normalize_e164(phone)
+        result["e164_format"] = self._normalize_e164_from_validation(validation)
         
         # Local format: 0XX-XXX-XXXX for mobile, varies for landline
         if result["type"] == "mobile" and len(normalized) == 10:
@@ -0,0 +1,528 @@
+# =============================================================================
+# SOCIAL MEDIA DATA COLLECTOR TESTS
+# =============================================================================
+# Unit tests for profile page parsing and Open Graph data extraction.
+# =============================================================================
+
+"""
+Social Media Data Collector Tests
+
+Test suite for the SocialMediaDataCollector service:
+- HTML parsing of profile pages
+- Platform-specific name and bio cleaning
+- Profile image and location extraction
+- URL allow-list (SSRF protection)
+
+Run with: pytest tests/test_data_collector.py -v
+"""
+
+import asyncio
+import gzip
+
+import httpx
+import pytest
+
+from app.services.social import data_collector
+from app.services.social.data_collector import SocialMediaDataCollector
+
+
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+INSTAGRAM_PAGE = b"""<!DOCTYPE html>
+<html><head>
+<meta charset="utf-8">
+<meta property="og:title" content="John Perera (@john_perera) &#x2022; Instagram photos and videos">
+<meta property="og:description" content="1,234 Followers, 56 Following, 78 Posts - Software developer | Colombo">
+<meta property="og:image" content="https://cdn.example.com/john.jpg">
+<meta name="description" content="Fallback description">
+</head><body><div>Lots of page content</div></body></html>"""
+
+
+@pytest.fixture
+def collector():
+    """Create a SocialMediaDataCollector instance for tests."""
+    return SocialMediaDataCollector()
+
+
+# =============================================================================
+# PARSING AND EXTRACTION TESTS
+# =============================================================================
+
+class TestProfileExtraction:
+    """Tests for extracting profile fields from parsed pages."""
+    
+    def test_extract_instagram_name(self, collector):
+        """Test that Instagram og:title is reduced to the display name."""
+        meta = collector._parse_html(INSTAGRAM_PAGE)
+        assert collector._extract_name(meta, "instagram") == "John Perera"
+    
+    def test_extract_instagram_bio(self, collector):
+        """Test that Instagram follower stats are stripped from the bio."""
+        meta = collector._parse_html(INSTAGRAM_PAGE)
+        assert collector._extract_bio(meta, "instagram") == "Software developer | Colombo"
+    
+    def test_instagram_bio_with_abbreviated_stats(self, collector):
+        """Test that abbreviated follower counts are stripped too."""
+        page = (
+            b'<html><head><meta property="og:description" content="1.2M Followers, '
+            b'10 Following, 300 Posts - Artist - Colombo"></head></html>'
+        )
+        meta = collector._parse_html(page)
+        assert collector._extract_bio(meta, "instagram") == "Artist - Colombo"
+    
+    def test_instagram_bio_without_stats_kept(self, collector):
+        """Test that a description without a stats prefix is left whole."""
+        page = b'<html><head><meta property="og:description" content="Chef - Kandy"></head></html>'
+        meta = collector._parse_html(page)
+        assert collector._extract_bio(meta, "instagram") == "Chef - Kandy"
+    
+    def test_extract_profile_image(self, collector):
+        """Test og:image extraction."""
+        meta = collector._parse_html(INSTAGRAM_PAGE)
+        assert (
+            collector._extract_profile_image(meta, "instagram")
+            == "https://cdn.example.com/john.jpg"
+        )
+    
+    def test_extract_facebook_name(self, collector):
+        """Test that the Facebook suffix is removed from og:title."""
+        page = b'<html><head><meta property="og:title" content="John Perera | Facebook"></head></html>'
+        meta = collector._parse_html(page)
+        assert collector._extract_name(meta, "facebook") == "John Perera"
+    
+    def test_extract_linkedin_name(self, collector):
+        """Test that the LinkedIn headline is removed from og:title."""
+        page = b'<html><head><meta property="og:title" content="John Perera - Engineer | LinkedIn"></head></html>'
+        meta = collector._parse_html(page)
+        assert collector._extract_name(meta, "linkedin") == "John Perera"
+    
+    def test_extract_x_name(self, collector):
+        """Test that the X handle is removed from og:title."""
+        page = b'<html><head><meta property="og:title" content="John Perera (@jperera) / X"></head></html>'
+        meta = collector._parse_html(page)
+        assert collector._extract_name(meta, "x") == "John Perera"
+    
+    def test_facebook_placeholder_bio_ignored(self, collector):
+        """Test that Facebook's generic description is not treated as a bio."""
+        page = (
+            b'<html><head><meta property="og:description" content="See photos, '
+            b'profile pictures and albums from John Perera."></head></html>'
+        )
+        meta = collector._parse_html(page)
+        assert collector._extract_bio(meta, "facebook") is None
+    
+    def test_bio_falls_back_to_description(self, collector):
+        """Test that the description meta tag is used without og:description."""
+        page = b'<html><head><meta name="description" content="Just a bio"></head></html>'
+        meta = collector._parse_html(page)
+        assert collector._extract_bio(meta, "x") == "Just a bio"
+    
+    def test_missing_tags_return_none(self, collector):
+        """Test that absent meta tags yield None."""
+        meta = collector._parse_html(b"<html><head></head><body></body></html>")
+        assert collector._extract_name(meta, "x") is None
+        assert collector._extract_bio(meta, "x") is None
+        assert collector._extract_location(meta, "x") is None
+    
+    def test_parse_empty_document(self, collector):
+        """Test that an empty body parses to an empty meta map."""
+        assert collector._parse_html(b"") == {}
+    
+    def test_first_meta_tag_wins(self, collector):
+        """Test that duplicate meta tags keep the first value."""
+        page = (
+            b'<html><head><meta property="og:title" content="First">'
+            b'<meta property="og:title" content="Second"></head></html>'
+        )
+        assert collector._get_og_content(collector._parse_html(page), "og:title") == "First"
+    
+    def test_lxml_fallback_matches(self, collector, monkeypatch):
+        """Test that the lxml backend builds the same map without selectolax."""
+        expected = collector._parse_html(INSTAGRAM_PAGE)
+        monkeypatch.setattr(data_collector, "SELECTOLAX_AVAILABLE", False)
+        
+        assert collector._parse_html(INSTAGRAM_PAGE) == expected
+
+
+# =============================================================================
+# URL VALIDATION TESTS
+# =============================================================================
+
+class TestUrlValidation:
+    """Tests for the SSRF allow-list."""
+    
+    def test_allowed_url(self, collector):
+        """Test that a known platform host is allowed."""
+        assert collector._is_url_allowed("https://www.instagram.com/john/", "instagram")
+    
+    def test_disallowed_host(self, collector):
+        """Test that other hosts are rejected."""
+        assert not collector._is_url_allowed("https://evil.com/john", "instagram")
+    
+    @pytest.mark.asyncio
+    async def test_collect_rejects_disallowed_url(self, collector):
+        """Test that collection fails fast for a disallowed domain."""
+        result = await collector.collect_profile_data("https://evil.com/x", "x")
+        
+        assert result["success"] is False
+        assert "not allowed" in result["error"]
+
+
+# =============================================================================
+# COLLECTION TESTS
+# =============================================================================
+
+class TestCollectProfileData:
+    """Tests for end-to-end collection with a mocked HTTP transport."""
+    
+    @pytest.mark.asyncio
+    async def test_collect_success(self):
+        """Test that a fetched page is parsed into profile fields."""
+        def handler(request):
+            return httpx.Response(200, content=INSTAGRAM_PAGE)
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        collector = SocialMediaDataCollector(client=client)
+        
+        result = await collector.collect_profile_data(
+            "https://www.instagram.com/john_perera/", "instagram"
+        )
+        await collector.aclose()
+        
+        assert result["success"] is True
+        assert result["name"] == "John Perera"
+        assert result["profile_image"] == "https://cdn.example.com/john.jpg"
+    
+    @pytest.mark.asyncio
+    async def test_collect_requests_compressed_html(self):
+        """Test that compressed HTML is requested and transparently decoded."""
+        seen = {}
+        
+        def handler(request):
+            seen["accept_encoding"] = request.headers.get("Accept-Encoding")
+            return httpx.Response(
+                200,
+                content=gzip.compress(INSTAGRAM_PAGE),
+                headers={"Content-Encoding": "gzip"}
+            )
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        collector = SocialMediaDataCollector(client=client)
+        
+        result = await collector.collect_profile_data(
+            "https://www.instagram.com/john_perera/", "instagram"
+        )
+        await collector.aclose()
+        
+        assert "gzip" in seen["accept_encoding"]
+        assert result["name"] == "John Perera"
+    
+    @pytest.mark.asyncio
+    async def test_collect_http_error(self):
+        """Test that a non-200 response is reported as an error."""
+        def handler(request):
+            return httpx.Response(404)
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        collector = SocialMediaDataCollector(client=client)
+        
+        result = await collector.collect_profile_data(
+            "https://www.instagram.com/missing/", "instagram"
+        )
+        await collector.aclose()
+        
+        assert result["success"] is False
+        assert result["error"] == "HTTP 404"
+    
+    @pytest.mark.asyncio
+    async def test_non_html_response_rejected(self):
+        """Test that a JSON body is reported instead of parsed."""
+        def handler(request):
+            return httpx.Response(200, json={"status": "redirect"})
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        collector = SocialMediaDataCollector(client=client)
+        
+        result = await collector.collect_profile_data(
+            "https://www.instagram.com/john_perera/", "instagram"
+        )
+        await collector.aclose()
+        
+        assert result["success"] is False
+        assert result["error"] == "Non-HTML content-type: application/json"
+    
+    @pytest.mark.asyncio
+    async def test_error_body_not_read(self):
+        """Test that a non-200 response body is never pulled from the stream."""
+        sent = []
+        
+        async def body():
+            sent.append(b"error page")
+            yield b"<html>error page</html>"
+        
+        def handler(request):
+            return httpx.Response(404, content=body())
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        collector = SocialMediaDataCollector(client=client)
+        
+        result = await collector.collect_profile_data(
+            "https://www.instagram.com/missing/", "instagram"
+        )
+        await collector.aclose()
+        
+        assert result["error"] == "HTTP 404"
+        assert sent == []
+    
+    @pytest.mark.asyncio
+    async def test_repeat_collection_is_cached(self):
+        """Test that a second lookup of the same URL reuses the first fetch."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.url)
+            return httpx.Response(200, content=INSTAGRAM_PAGE)
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        collector = SocialMediaDataCollector(client=client)
+        url = "https://www.instagram.com/john_perera/"
+        
+        first = await collector.collect_profile_data(url, "instagram")
+        first["name"] = "mutated"
+        second = await collector.collect_profile_data(url, "instagram")
+        
+        assert len(calls) == 1
+        assert second["name"] == "John Perera"
+        
+        collector.invalidate(url)
+        await collector.collect_profile_data(url, "instagram")
+        await collector.aclose()
+        
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_failed_collection_negative_cached(self):
+        """Test that error results are reused only for the short negative TTL."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.url)
+            return httpx.Response(404)
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        collector = SocialMediaDataCollector(client=client)
+        url = "https://www.instagram.com/missing/"
+        
+        await collector.collect_profile_data(url, "instagram")
+        second = await collector.collect_profile_data(url, "instagram")
+        assert len(calls) == 1
+        assert second["error"] == "HTTP 404"
+        
+        # Age the entry past the negative TTL but within the positive one
+        key = (url, "instagram")
+        timestamp, result = collector._profile_cache[key]
+        collector._profile_cache[key] = (
+            timestamp - collector.NEGATIVE_CACHE_TTL_SECONDS - 1, result
+        )
+        await collector.collect_profile_data(url, "instagram")
+        await collector.aclose()
+        
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_fetch_lock_kept_while_waiters_remain(self):
+        """Test that a late caller queues behind a waiter instead of fetching alongside it."""
+        in_flight = 0
+        peak = 0
+        
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(404)
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        collector = SocialMediaDataCollector(client=client)
+        collector.NEGATIVE_CACHE_TTL_SECONDS = -1  # every caller fetches
+        url = "https://www.instagram.com/missing/"
+        
+        first = asyncio.create_task(collector.collect_profile_data(url, "instagram"))
+        waiter = asyncio.create_task(collector.collect_profile_data(url, "instagram"))
+        await first
+        late = asyncio.create_task(collector.collect_profile_data(url, "instagram"))
+        await asyncio.gather(waiter, late)
+        await collector.aclose()
+        
+        assert peak == 1
+        assert collector._fetch_locks == {}
+    
+    @pytest.mark.asyncio
+    async def test_collect_stops_reading_after_head(self):
+        """Test that the body beyond </head> is never pulled from the stream."""
+        sent = []
+        
+        async def body():
+            for chunk in (INSTAGRAM_PAGE, b"<div>" + b"x" * 100_000, b"</div>"):
+                sent.append(chunk)
+                yield chunk
+        
+        def handler(request):
+            return httpx.Response(200, content=body())
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        collector = SocialMediaDataCollector(client=client)
+        
+        result = await collector.collect_profile_data(
+            "https://www.instagram.com/john_perera/", "instagram"
+        )
+        await collector.aclose()
+        
+        assert result["name"] == "John Perera"
+        assert len(sent) == 1
+    
+    @pytest.mark.asyncio
+    async def test_read_head_slices_at_marker(self, collector):
+        """Test that body markup sharing a chunk with </head> is dropped."""
+        async def body():
+            yield INSTAGRAM_PAGE
+        
+        response = httpx.Response(200, content=body())
+        content = await collector._read_head(response)
+        
+        assert content.endswith(b"</head>")
+        assert b"<body>" not in content
+    
+    @pytest.mark.asyncio
+    async def test_read_head_drains_small_http11_remainder(self, collector):
+        """Test that a small sized HTTP/1.1 remainder is read to keep the connection."""
+        tail = b"<div>" + b"x" * 1000 + b"</div>"
+        sent = []
+        
+        async def body():
+            for chunk in (INSTAGRAM_PAGE, tail):
+                sent.append(chunk)
+                yield chunk
+        
+        response = httpx.Response(
+            200,
+            headers={"content-length": str(len(INSTAGRAM_PAGE) + len(tail))},
+            content=body()
+        )
+        content = await collector._read_head(response)
+        
+        assert content.endswith(b"</head>")
+        assert len(sent) == 2
+    
+    @pytest.mark.asyncio
+    async def test_read_head_skips_drain_over_http2(self, collector):
+        """Test that HTTP/2 responses are not drained (the stream is just reset)."""
+        tail = b"<div>" + b"x" * 1000 + b"</div>"
+        sent = []
+        
+        async def body():
+            for chunk in (INSTAGRAM_PAGE, tail):
+                sent.append(chunk)
+                yield chunk
+        
+        response = httpx.Response(
+            200,
+            headers={"content-length": str(len(INSTAGRAM_PAGE) + len(tail))},
+            content=body(),
+            extensions={"http_version": b"HTTP/2"}
+        )
+        await collector._read_head(response)
+        
+        assert len(sent) == 1
+
+
+# =============================================================================
+# HOST BACKOFF TESTS
+# =============================================================================
+
+class TestHostBackoff:
+    """Tests for the per-host adaptive delay."""
+    
+    def test_throttled_response_sets_delay(self, collector):
+        """Test that a 429 starts the backoff and repeats double it."""
+        response = httpx.Response(429)
+        
+        collector._record_host_response("x.com", response)
+        assert collector._host_delays["x.com"] == collector.HOST_BACKOFF_INITIAL
+        
+        collector._record_host_response("x.com", response)
+        assert collector._host_delays["x.com"] == collector.HOST_BACKOFF_INITIAL * 2
+    
+    def test_retry_after_honoured_and_capped(self, collector):
+        """Test that Retry-After raises the delay but not past the cap."""
+        collector._record_host_response(
+            "x.com", httpx.Response(429, headers={"Retry-After": "10"})
+        )
+        assert collector._host_delays["x.com"] == 10.0
+        
+        collector._record_host_response(
+            "x.com", httpx.Response(429, headers={"Retry-After": "3600"})
+        )
+        assert collector._host_delays["x.com"] == collector.HOST_BACKOFF_MAX
+    
+    def test_success_decays_delay(self, collector):
+        """Test that successful responses shrink the delay."""
+        collector._host_delays["x.com"] = 1.0
+        
+        collector._record_host_response("x.com", httpx.Response(200))
+        
+        assert collector._host_delays["x.com"] == pytest.approx(0.9)
+
+
+# =============================================================================
+# BATCH COLLECTION TESTS
+# =============================================================================
+
+class TestCollectProfiles:
+    """Tests for concurrent multi-profile collection."""
+    
+    @pytest.mark.asyncio
+    async def test_results_in_target_order(self):
+        """Test that batch results line up with their targets."""
+        def handler(request):
+            if request.url.host == "x.com":
+                return httpx.Response(404)
+            return httpx.Response(200, content=INSTAGRAM_PAGE)
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        collector = SocialMediaDataCollector(client=client)
+        
+        results = await collector.collect_profiles([
+            ("https://x.com/john_perera", "x"),
+            ("https://www.instagram.com/john_perera/", "instagram"),
+            ("https://evil.com/john", "facebook"),
+        ])
+        await collector.aclose()
+        
+        assert [r["platform"] for r in results] == ["x", "instagram", "facebook"]
+        assert results[0]["error"] == "HTTP 404"
+        assert results[1]["name"] == "John Perera"
+        assert "not allowed" in results[2]["error"]
+
+
+# =============================================================================
+# DEFAULT COLLECTOR TESTS
+# =============================================================================
+
+class TestDefaultCollector:
+    """Tests for the lazily created module-level collector."""
+    
+    @pytest.mark.asyncio
+    async def test_default_collector_lifecycle(self):
+        """Test that the default collector is created once and reset on close."""
+        await data_collector.aclose_default()
+        assert data_collector._default_collector is None
+        
+        first = data_collector.get_default_collector()
+        assert data_collector.get_default_collector() is first
+        
+        await data_collector.aclose_default()
+        assert data_collector._default_collector is None
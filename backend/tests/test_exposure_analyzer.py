@@ -204,6 +204,19 @@ class TestUserIdentifierMatching:
         
         assert matched[0]["matches_user_input"] is True
     
+    def test_match_username_in_name(self, analyzer):
+        """Test that a username spelled out in the display name matches."""
+        exposed_pii = [
+            {"type": "name", "value": "John Perera", "platforms": ["x"], "platform_count": 1, "risk_level": "low"},
+            {"type": "location", "value": "johnperera", "platforms": ["x"], "platform_count": 1, "risk_level": "medium"}
+        ]
+        user_identifiers = {"username": "@JohnPerera"}
+        
+        matched = analyzer._match_to_user_identifiers(exposed_pii, user_identifiers)
+        
+        assert matched[0]["matches_user_input"] is True
+        assert matched[1]["matches_user_input"] is False
+    
     def test_no_match_different_values(self, analyzer):
         """Test that different values don't match."""
         exposed_pii = [
@@ -276,6 +289,18 @@ class TestExposureScoreCalculation:
         score = analyzer._calculate_exposure_score(exposed_pii)
         
         assert score <= 100
+    
+    def test_fused_match_and_score_agrees(self, analyzer, sample_platform_data, sample_user_identifiers):
+        """Test that the one-pass path matches the separate match and score steps."""
+        fused_pii = analyzer._consolidate_pii(sample_platform_data)
+        fused_score = analyzer._match_and_score(fused_pii, sample_user_identifiers)
+        
+        separate_pii = analyzer._match_to_user_identifiers(
+            analyzer._consolidate_pii(sample_platform_data), sample_user_identifiers
+        )
+        
+        assert fused_pii == separate_pii
+        assert fused_score == analyzer._calculate_exposure_score(separate_pii)
 
 
 # =============================================================================
@@ -368,7 +393,14 @@ class TestPIIExtractionFromText:
         text = "Email john@example.com or jane@test.org"
         result = analyzer.extract_pii_from_text(text)
         
-        assert len(result["emails"]) == 2
+        assert result["emails"] == ["john@example.com", "jane@test.org"]
+    
+    def test_duplicate_matches_deduplicated_in_order(self, analyzer):
+        """Test that repeated matches are listed once, in first-seen order."""
+        text = "b@test.org, a@test.org, b@test.org"
+        result = analyzer.extract_pii_from_text(text)
+        
+        assert result["emails"] == ["b@test.org", "a@test.org"]
     
     def test_extract_sri_lankan_phone(self, analyzer):
         """Test extracting Sri Lankan phone numbers."""
@@ -391,6 +423,13 @@ class TestPIIExtractionFromText:
         
         assert len(result["phones"]) >= 1
     
+    def test_long_digit_run_not_a_phone(self, analyzer):
+        """Test that digits inside a longer number are not reported as a phone."""
+        text = "Card 4111111111111111, ref 12345678901234"
+        result = analyzer.extract_pii_from_text(text)
+        
+        assert result["phones"] == []
+    
     def test_extract_url_from_text(self, analyzer):
         """Test extracting URLs from text."""
         text = "Visit https://example.com for more info"
@@ -398,6 +437,35 @@ class TestPIIExtractionFromText:
         
         assert "https://example.com" in result["urls"]
     
+    def test_mixed_text_single_pass(self, analyzer):
+        """Test that digits inside emails and URLs are not reported as phones."""
+        text = "Mail perera0771234567@example.com, see https://t.me/0771234567 or call 0712345678"
+        result = analyzer.extract_pii_from_text(text)
+        
+        assert result["emails"] == ["perera0771234567@example.com"]
+        assert result["urls"] == ["https://t.me/0771234567"]
+        assert result["phones"] == ["0712345678"]
+    
+    def test_email_inside_url_still_extracted(self, analyzer):
+        """Test that an email embedded in a link is reported as well as the link."""
+        result = analyzer.extract_pii_from_text("https://site.com/?contact=john@x.com")
+        
+        assert result["emails"] == ["john@x.com"]
+        assert result["urls"] == ["https://site.com/?contact=john@x.com"]
+    
+    def test_text_without_pii_markers(self, analyzer):
+        """Test that text with no "@", URL or digits yields empty lists."""
+        result = analyzer.extract_pii_from_text("Coffee lover and weekend hiker")
+        
+        assert result == {"emails": [], "phones": [], "urls": []}
+    
+    def test_oversized_text_is_truncated(self, analyzer):
+        """Test that only the leading MAX_PII_TEXT_LENGTH characters are scanned."""
+        padding = "x" * analyzer.MAX_PII_TEXT_LENGTH
+        result = analyzer.extract_pii_from_text("a@test.org " + padding + " b@test.org")
+        
+        assert result["emails"] == ["a@test.org"]
+    
     def test_empty_text_returns_empty_lists(self, analyzer):
         """Test that empty text returns empty lists."""
         result = analyzer.extract_pii_from_text("")
@@ -457,6 +525,40 @@ class TestFullAnalysis:
         assert result["scan_timestamp"].endswith("Z")
         assert "T" in result["scan_timestamp"]
     
+    def test_repeat_analysis_served_from_cache(self, analyzer, sample_platform_data, sample_user_identifiers, monkeypatch):
+        """Test that identical inputs reuse the report and callers get copies."""
+        first = analyzer.analyze(sample_platform_data, sample_user_identifiers)
+        first["exposed_pii"].clear()
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("report was rebuilt")
+        
+        monkeypatch.setattr(analyzer, "_build_report", fail)
+        second = analyzer.analyze(sample_platform_data, sample_user_identifiers)
+        
+        assert second["total_exposed_items"] == len(second["exposed_pii"]) > 0
+    
+    def test_changed_pii_field_rebuilds_report(self, analyzer, sample_platform_data, sample_user_identifiers):
+        """Test that a changed PII field misses the cache while other data does not."""
+        first = analyzer.analyze(sample_platform_data, sample_user_identifiers)
+        
+        sample_platform_data["facebook"]["data"]["followers"] = 12345
+        assert analyzer.analyze(sample_platform_data, sample_user_identifiers)["exposed_pii"] == first["exposed_pii"]
+        
+        sample_platform_data["facebook"]["data"]["location"] = "Kandy, Sri Lanka"
+        rebuilt = analyzer.analyze(sample_platform_data, sample_user_identifiers)
+        
+        assert any(item["value"] == "Kandy, Sri Lanka" for item in rebuilt["exposed_pii"])
+    
+    def test_cached_report_copy_keeps_shared_items(self, analyzer, sample_platform_data, sample_user_identifiers):
+        """Test that copies share items between exposed_pii and the breakdown, as built."""
+        analyzer.analyze(sample_platform_data, sample_user_identifiers)
+        report = analyzer.analyze(sample_platform_data, sample_user_identifiers)
+        
+        item = report["platform_breakdown"]["facebook"]["exposed_items"][0]
+        
+        assert any(item is pii for pii in report["exposed_pii"])
+    
     def test_analyze_empty_data(self, analyzer):
         """Test analysis with empty platform data."""
         result = analyzer.analyze({}, {"username": "test"})
@@ -16,6 +16,8 @@ Tests cover:
 
 import pytest
 import asyncio
+import httpx
+from urllib.parse import quote_plus
 from app.services.social.google_dorker import GoogleDorkSearcher
 from app.services.social.profile_finder import HybridProfileFinder
 
@@ -59,6 +61,15 @@ class TestGoogleDorkSearcher:
         assert "john_doe" in identifiers
         assert "johndoe" in identifiers
     
+    def test_username_variations_original_first_and_unique(self, searcher):
+        """Test that variations start with the original and contain no duplicates."""
+        variations = searcher._generate_username_variations("John.Doe")
+        assert variations[0] == "john.doe"
+        assert len(variations) == len(set(variations))
+        assert set(variations) == {"john.doe", "johndoe", "john_doe"}
+        
+        assert searcher._generate_username_variations("johndoe") == ["johndoe"]
+    
     def test_search_by_username_strips_at_symbol(self, searcher):
         """Test that @ symbol is stripped from usernames."""
         results = searcher.search_by_username("@john_doe")
@@ -167,6 +178,56 @@ class TestGoogleDorkSearcher:
         """Test that empty phone returns empty list."""
         assert searcher.search_by_phone("") == []
     
+    def test_repeat_search_cached_and_isolated(self, searcher):
+        """Test that repeat searches are cached and returned as fresh copies."""
+        first = searcher.search_by_username("john_doe")
+        first[0]["potential_profiles"].append("https://x.com/john_doe")
+        first[0]["query"] = "mutated"
+        
+        second = searcher.search_by_username("john_doe")
+        
+        assert searcher._search_by_username_cached.cache_info().hits == 1
+        assert second[0]["potential_profiles"] == []
+        assert second[0]["query"] != "mutated"
+    
+    def test_result_keys_per_search_type(self, searcher):
+        """Test that each search type returns its own set of result keys."""
+        base = {"platform", "platform_id", "query", "search_url",
+                "search_type", "identifier", "potential_profiles"}
+        
+        assert set(searcher.search_by_name("John")[0]) == base
+        assert set(searcher.search_by_email("john@test.com")[0]) == base
+        assert set(searcher.search_by_username("john")[0]) == base | {"is_variation", "original_username"}
+        assert set(searcher.search_by_phone("0771234567")[0]) == base | {"original_phone"}
+    
+    def test_iter_search_is_lazy_and_matches_list(self, searcher):
+        """Test that iter_search_by_* yields the same results as search_by_*."""
+        iterator = searcher.iter_search_by_phone("0771234567")
+        first = next(iterator)
+        
+        assert first == searcher.search_by_phone("0771234567")[0]
+        assert list(searcher.iter_search_by_username("   ")) == []
+    
+    def test_default_searcher_created_lazily(self):
+        """Test that the module-level searcher is created once, on first use."""
+        from app.services.social import google_dorker
+        
+        google_dorker._default_searcher = None
+        results = google_dorker.search_by_username("john_doe")
+        
+        assert results
+        assert google_dorker._default_searcher is not None
+        assert google_dorker.get_default_searcher() is google_dorker._default_searcher
+    
+    def test_search_url_encoding_matches_quote_plus(self, searcher):
+        """Test that search URLs are encoded exactly as quote_plus would."""
+        results = searcher.search_by_name("Jöhn Pérera") + searcher.search_by_email("a+b@test.com")
+        
+        for result in results:
+            prefix, _, encoded = result["search_url"].partition("?q=")
+            assert prefix == "https://www.google.com/search"
+            assert encoded == quote_plus(result["query"])
+    
     # -------------------------------------------------------------------------
     # URL FILTERING TESTS
     # -------------------------------------------------------------------------
@@ -202,6 +263,86 @@ class TestGoogleDorkSearcher:
             "https://instagram.com/john.doe/", "instagram"
         ) == "john.doe"
     
+    def test_extract_username_rejects_non_profile_shapes(self, searcher):
+        """Test that extraction only accepts a single trailing profile segment."""
+        assert searcher.extract_username_from_url("https://linkedin.com/in/john-doe/", "linkedin") == "john-doe"
+        assert searcher.extract_username_from_url("https://twitter.com/john_doe", "x") == "john_doe"
+        assert searcher.extract_username_from_url("https://facebook.com/john?ref=1", "facebook") is None
+        assert searcher.extract_username_from_url("https://facebook.com/people/john", "facebook") is None
+        assert searcher.extract_username_from_url("https://facebook.com//", "facebook") is None
+        assert searcher.extract_username_from_url("https://linkedin.com/john", "linkedin") is None
+    
+    def test_filter_profile_urls(self, searcher):
+        """Test that non-profile URLs are dropped and usernames extracted."""
+        filtered = searcher.filter_profile_urls([
+            "https://instagram.com/john.doe/",
+            "https://instagram.com/explore/tags/x",
+            "",
+            "https://instagram.com/p/abc/",
+        ], "instagram")
+        
+        assert [f["url"] for f in filtered] == [
+            "https://instagram.com/john.doe/", "https://instagram.com/p/abc/"
+        ]
+        assert filtered[0]["username"] == "john.doe"
+        assert filtered[0]["platform"] == "Instagram"
+        assert filtered[1]["username"] is None
+    
+    @pytest.fixture
+    def no_pacing(self, monkeypatch):
+        """Disable request spacing and retry backoff for fetch tests."""
+        monkeypatch.setattr(GoogleDorkSearcher, "DELAY_BETWEEN_REQUESTS", 0)
+        monkeypatch.setattr(GoogleDorkSearcher, "RETRY_BASE_DELAY", 0)
+    
+    @pytest.mark.asyncio
+    async def test_fetch_all_populates_potential_profiles(self, searcher, no_pacing):
+        """Test that fetch_all fills potential_profiles from results pages over one client."""
+        page = (
+            '<a href="/url?q=https://facebook.com/john_doe&amp;sa=U">John</a>'
+            '<a href="/url?q=https://facebook.com/john_doe&amp;sa=U">John again</a>'
+            '<a href="https://facebook.com/help/">Help</a>'
+            '<a href="https://facebook.com/jdoe">J</a>'
+        )
+        requested = []
+        
+        def handler(request):
+            requested.append(str(request.url))
+            if "instagram" in str(request.url):
+                return httpx.Response(429)
+            return httpx.Response(200, text=page)
+        
+        results = searcher.search_by_name("John Doe", None)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await searcher.fetch_all(results, client=client)
+        
+        by_platform = {r["platform_id"]: r for r in results}
+        throttled = sum("instagram" in url for url in requested)
+        assert throttled == searcher.MAX_RETRIES
+        assert len(requested) == len(results) - 1 + throttled
+        assert by_platform["facebook"]["potential_profiles"] == [
+            "https://facebook.com/john_doe", "https://facebook.com/jdoe"
+        ]
+        assert by_platform["instagram"]["potential_profiles"] == []
+    
+    @pytest.mark.asyncio
+    async def test_fetch_all_retries_throttled_requests(self, searcher, no_pacing):
+        """Test that a 503 from Google is retried and the later page is used."""
+        page = '<a href="/url?q=https://facebook.com/john_doe&amp;sa=U">John</a>'
+        attempts = []
+        
+        def handler(request):
+            attempts.append(str(request.url))
+            if len(attempts) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, text=page)
+        
+        results = [r for r in searcher.search_by_name("John Doe", None) if r["platform_id"] == "facebook"]
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await searcher.fetch_all(results, client=client)
+        
+        assert len(attempts) == 2
+        assert results[0]["potential_profiles"] == ["https://facebook.com/john_doe"]
+    
     # -------------------------------------------------------------------------
     # HELPER METHOD TESTS
     # -------------------------------------------------------------------------
@@ -455,6 +596,30 @@ class TestPhoneNumberFormats:
         """Test that formatted international variations are generated."""
         variations = searcher._generate_phone_variations("0771234567")
         assert "+94 77 123 4567" in variations
+    
+    def test_phone_variations_deterministic_order(self, searcher):
+        """Test that variations come back in a fixed order without duplicates."""
+        assert searcher._generate_phone_variations("+94771234567") == [
+            "0771234567",
+            "+94771234567",
+            "94771234567",
+            "077-123-4567",
+            "077 123 4567",
+            "+94 77 123 4567",
+        ]
+    
+    def test_phone_variations_cached_per_number(self, searcher):
+        """Test that repeat variation calls hit the cache and return fresh lists."""
+        from app.services.social.google_dorker import _phone_variations
+        
+        _phone_variations.cache_clear()
+        first = searcher._generate_phone_variations("0771234567")
+        first.append("mutated")
+        second = searcher._generate_phone_variations("0771234567")
+        
+        assert _phone_variations.cache_info().hits == 1
+        assert "mutated" not in second
+        assert searcher._generate_phone_variations("12345") == []
 
 
 # =============================================================================
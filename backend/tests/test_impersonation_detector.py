@@ -287,6 +287,55 @@ class TestLocationMismatchDetection:
             indicators = risk.get("indicators", [])
             location_indicators = [i for i in indicators if i.get("type") == "location_mismatch"]
             assert len(location_indicators) == 0
+    
+    def test_short_codes_match_whole_words_only(self, detector):
+        """Test that 'sl'/'lk' inside other place names do not count as Sri Lanka."""
+        platform_data = {
+            "facebook": {
+                "status": "found",
+                "url": "https://www.facebook.com/johnperera",
+                "data": {"name": "John", "bio": "Giveaway!", "location": "Islamabad, Pakistan"}
+            },
+            "instagram": {
+                "status": "found",
+                "url": "https://www.instagram.com/johnperera/",
+                "data": {"name": "John", "bio": "Giveaway!", "location": "Kandy, LK"}
+            }
+        }
+        user_ids = {"username": "johnperera", "location": "Sri Lanka"}
+        
+        risks = {r["platform"]: r for r in detector.detect(platform_data, user_ids)}
+        
+        def location_flags(platform):
+            return [i for i in risks[platform]["indicators"] if i["type"] == "location_mismatch"]
+        
+        assert len(location_flags("facebook")) == 1
+        assert location_flags("instagram") == []
+    
+    def test_place_names_match_as_word_prefixes(self, detector):
+        """Test that 'Sri Lankan' and 'Colombo 07' style locations count as Sri Lanka."""
+        locations = {
+            "facebook": "Sri Lankan",
+            "instagram": "Srilankan living abroad",
+            "linkedin": "Colombo 07",
+            "twitter": "Colombo07",
+        }
+        platform_data = {
+            platform: {
+                "status": "found",
+                "url": f"https://www.{platform}.com/johnperera",
+                "data": {"name": "John", "bio": "Giveaway!", "location": location}
+            }
+            for platform, location in locations.items()
+        }
+        user_ids = {"username": "johnperera", "location": "Sri Lanka"}
+        
+        risks = detector.detect(platform_data, user_ids)
+        
+        assert len(risks) == len(locations)
+        for risk in risks:
+            location_indicators = [i for i in risk["indicators"] if i["type"] == "location_mismatch"]
+            assert location_indicators == []
 
 
 # =============================================================================
@@ -332,6 +381,49 @@ class TestSuspiciousBioDetection:
         bio_indicators = [i for i in indicators if i.get("type") == "suspicious_bio"]
         assert len(bio_indicators) >= 1
     
+    def test_bio_indicator_reports_pattern_string(self, detector):
+        """Test that the matched pattern is reported as its source string."""
+        platform_data = {
+            "instagram": {
+                "status": "found",
+                "url": "https://www.instagram.com/johnperera/",
+                "data": {"name": "John", "bio": "Forex Trading tips", "location": "Colombo"}
+            }
+        }
+        user_ids = {"username": "johnperera", "location": "Sri Lanka"}
+        
+        risks = detector.detect(platform_data, user_ids)
+        
+        bio_indicators = [i for i in risks[0]["indicators"] if i["type"] == "suspicious_bio"]
+        assert bio_indicators[0]["details"]["matched_pattern"] == r"forex\s*trading"
+    
+    def test_bio_reports_first_configured_pattern(self, detector):
+        """Test that with several matches the earliest configured pattern is reported."""
+        platform_data = {
+            "instagram": {
+                "status": "found",
+                "url": "https://www.instagram.com/johnperera/",
+                "data": {"name": "John", "bio": "Act now to join the giveaway", "location": "Colombo"}
+            }
+        }
+        user_ids = {"username": "johnperera", "location": "Sri Lanka"}
+        
+        risks = detector.detect(platform_data, user_ids)
+        
+        bio_indicators = [i for i in risks[0]["indicators"] if i["type"] == "suspicious_bio"]
+        assert len(bio_indicators) == 1
+        assert bio_indicators[0]["details"]["matched_pattern"] == "giveaway"
+    
+    def test_every_bio_pattern_has_prefilter_anchor(self, detector):
+        """Test that the substring prefilter cannot hide any bio pattern."""
+        for pattern in detector.SUSPICIOUS_BIO_PATTERNS:
+            assert any(anchor in pattern for anchor in detector._BIO_ANCHORS), pattern
+    
+    def test_bio_patterns_are_lowercase(self, detector):
+        """Test that bio patterns stay lowercase (bios are lowercased, no IGNORECASE)."""
+        for pattern in detector.SUSPICIOUS_BIO_PATTERNS:
+            assert pattern == pattern.lower(), pattern
+    
     def test_clean_bio_no_detection(self, detector):
         """Test that clean bio doesn't trigger detection."""
         platform_data = {
@@ -390,6 +482,18 @@ class TestRiskLevelCalculation:
         for risk in risks:
             confidence = risk.get("confidence_score", 0)
             assert 0.0 <= confidence <= 1.0
+    
+    def test_calculate_risk_counts_severities(self, detector):
+        """Test risk level and confidence from mixed severities."""
+        from app.services.social.impersonation_detector import _Indicator
+        
+        def make(severity):
+            return _Indicator(type="t", severity=severity, description="", details={})
+        
+        assert detector._calculate_risk([]) == ("low", 0.0)
+        assert detector._calculate_risk([make("high"), make("medium")]) == ("medium", 0.83)
+        assert detector._calculate_risk([make("high"), make("high")]) == ("high", 1.0)
+        assert detector._calculate_risk([make("low"), make("unknown")]) == ("low", 0.17)
 
 
 # =============================================================================
@@ -413,6 +517,9 @@ class TestFullDetectionWorkflow:
             assert "indicators" in risk
             assert "recommendation" in risk
             assert "report_url" in risk
+            for indicator in risk["indicators"]:
+                assert isinstance(indicator, dict)
+                assert set(indicator) == {"type", "severity", "description", "details"}
     
     def test_skips_not_found_profiles(self, detector):
         """Test that not_found profiles are skipped."""
@@ -484,3 +591,18 @@ class TestUsernameExtraction:
         username = detector._extract_username_from_url("")
         
         assert username == ""
+
+
+# =============================================================================
+# NAME SIMILARITY TESTS
+# =============================================================================
+
+class TestNameSimilarity:
+    """Tests for token-based name similarity."""
+    
+    def test_jaccard_similarity(self, detector):
+        """Test Jaccard similarity over case-insensitive name tokens."""
+        assert detector._calculate_name_similarity("John Perera", "john perera") == 1.0
+        assert detector._calculate_name_similarity("John Perera", "John Silva") == 1 / 3
+        assert detector._calculate_name_similarity("John", "") == 0.0
+        assert detector._calculate_name_similarity("   ", "John") == 0.0
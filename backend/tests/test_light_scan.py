@@ -16,7 +16,13 @@ Tests cover:
 
 import pytest
 import asyncio
-from app.services.scan.light_scan import LightScanService
+import httpx
+from app.services.scan.light_scan import (
+    LightScanService,
+    PlatformHits,
+    _decode_google_redirect,
+    get_light_scan_service,
+)
 
 
 # =============================================================================
@@ -162,6 +168,13 @@ class TestLightScanService:
         assert "johndoe" in variations  # Without dot
         assert "john_doe" in variations  # With underscore instead
     
+    def test_generate_queries_are_unique_per_platform(self, service):
+        """Test that duplicate dork queries are dropped before dispatch."""
+        queries = service._generate_queries("username", "john_doe", "Sri Lanka")
+        
+        for platform_queries in queries.values():
+            assert len(platform_queries) == len(set(platform_queries))
+    
     # -------------------------------------------------------------------------
     # PLATFORM CONFIGURATION TESTS
     # -------------------------------------------------------------------------
@@ -294,12 +307,161 @@ class TestLightScanService:
             "https://x.com/hashtag/tech", "x"
         )
     
+    def test_lookalike_domain_rejected(self, service):
+        """Test that look-alike and subdomain hosts are rejected."""
+        assert not service._is_valid_profile_url("https://fakex.com/john", "x")
+        assert not service._is_valid_profile_url("https://evil.x.com/john", "x")
+        assert service._is_valid_profile_url("https://www.twitter.com/john", "x")
+    
+    def test_invalid_nested_excluded_segment(self, service):
+        """Test that excluded pages below a profile are rejected."""
+        assert not service._is_valid_profile_url(
+            "https://www.facebook.com/john.perera/About", "facebook"
+        )
+    
+    def test_username_starting_with_excluded_word(self, service):
+        """Test that usernames merely prefixed by an excluded word pass."""
+        assert service._is_valid_profile_url(
+            "https://www.instagram.com/searchlight_studio/", "instagram"
+        )
+    
     def test_invalid_linkedin_jobs_url(self, service):
         """Test that LinkedIn jobs page URLs are rejected."""
         assert not service._is_valid_profile_url(
             "https://linkedin.com/jobs/view/12345", "linkedin"
         )
     
+    # -------------------------------------------------------------------------
+    # SEARCH RESULT PARSING TESTS
+    # -------------------------------------------------------------------------
+    
+    def test_decode_google_redirect(self):
+        """Test decoding of Google /url?q= redirect links."""
+        href = "/url?q=https://www.facebook.com/john%2Eperera&sa=U&ved=abc"
+        assert _decode_google_redirect(href) == "https://www.facebook.com/john.perera"
+    
+    def test_decode_google_redirect_q_not_first(self):
+        """Test decoding when q is not the first parameter."""
+        href = "/url?sa=t&q=https://x.com/john&ved=abc"
+        assert _decode_google_redirect(href) == "https://x.com/john"
+    
+    def test_decode_google_redirect_passthrough(self):
+        """Test that direct URLs are returned unchanged."""
+        assert _decode_google_redirect("https://x.com/john") == "https://x.com/john"
+        assert _decode_google_redirect("/url?sa=t") == ""
+    
+    def test_extract_search_results_from_redirects(self, service):
+        """Test that result divs with redirect links are parsed."""
+        from bs4 import BeautifulSoup
+        html = (
+            '<div class="g"><a href="/url?q=https://www.instagram.com/johndoe/&amp;sa=U">'
+            '<h3>John Doe (@johndoe)</h3></a>'
+            '<div class="VwiC3b">Photos and videos</div></div>'
+        )
+        
+        results = service._extract_search_results(BeautifulSoup(html, "lxml"))
+        
+        assert results == [{
+            "title": "John Doe (@johndoe)",
+            "url": "https://www.instagram.com/johndoe/",
+            "snippet": "Photos and videos",
+        }]
+    
+    # -------------------------------------------------------------------------
+    # RATE LIMITING TESTS
+    # -------------------------------------------------------------------------
+    
+    @pytest.mark.asyncio
+    async def test_rate_limiter_spaces_request_starts(self, service):
+        """Test that request starts are spaced by the configured delay."""
+        service.DELAY_BETWEEN_REQUESTS = 0.2
+        loop = asyncio.get_running_loop()
+        
+        await service._acquire_request_slot()
+        first = loop.time()
+        await service._acquire_request_slot()
+        second = loop.time()
+        
+        assert second - first >= 0.15
+    
+    @pytest.mark.asyncio
+    async def test_rate_limiter_first_request_not_delayed(self, service):
+        """Test that the first request is dispatched immediately."""
+        loop = asyncio.get_running_loop()
+        
+        start = loop.time()
+        await service._acquire_request_slot()
+        
+        assert loop.time() - start < 0.1
+    
+    @pytest.mark.asyncio
+    async def test_retry_on_transient_status(self, service):
+        """Test that 429/503 responses are retried until success."""
+        service.DELAY_BETWEEN_REQUESTS = 0
+        service.RETRY_BASE_DELAY = 0
+        statuses = iter([429, 503, 200])
+        
+        def handler(request):
+            return httpx.Response(next(statuses), text="<html></html>")
+        
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            response = await service._get_with_retry(
+                client, service.GOOGLE_SEARCH_URL, {"q": "test"}
+            )
+        
+        assert response.status_code == 200
+    
+    @pytest.mark.asyncio
+    async def test_retry_gives_up_after_max_attempts(self, service):
+        """Test that retries stop after MAX_RETRIES attempts."""
+        service.DELAY_BETWEEN_REQUESTS = 0
+        service.RETRY_BASE_DELAY = 0
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429)
+        
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            response = await service._get_with_retry(
+                client, service.GOOGLE_SEARCH_URL, {"q": "test"}
+            )
+        
+        assert response.status_code == 429
+        assert len(calls) == service.MAX_RETRIES
+    
+    # -------------------------------------------------------------------------
+    # CUSTOM SEARCH API TESTS
+    # -------------------------------------------------------------------------
+    
+    @pytest.mark.asyncio
+    async def test_cse_search_filters_profile_urls(self):
+        """Test that Custom Search API results are filtered to profiles."""
+        service = LightScanService(cse_api_key="key", cse_id="cx")
+        payload = {
+            "items": [
+                {"title": "John Doe", "link": "https://www.instagram.com/johndoe/",
+                 "snippet": "Photos"},
+                {"title": "Explore", "link": "https://www.instagram.com/explore/"},
+            ]
+        }
+        
+        def handler(request):
+            assert request.url.host == "www.googleapis.com"
+            assert request.url.params["cx"] == "cx"
+            return httpx.Response(200, json=payload)
+        
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            results = await service._execute_single_search(
+                client, 'site:instagram.com "johndoe"', "instagram"
+            )
+        
+        assert results == [{
+            "title": "John Doe",
+            "url": "https://www.instagram.com/johndoe/",
+            "snippet": "Photos",
+        }]
+    
     # -------------------------------------------------------------------------
     # SCAN RESPONSE TESTS
     # -------------------------------------------------------------------------
@@ -473,6 +635,12 @@ class TestLightScanService:
         config = service.get_platform_config("invalid_platform")
         
         assert config is None
+    
+    def test_get_light_scan_service_singleton(self):
+        """Test that the module-level accessor returns one shared instance."""
+        get_light_scan_service.cache_clear()
+        
+        assert get_light_scan_service() is get_light_scan_service()
 
 
 # =============================================================================
@@ -501,6 +669,216 @@ class TestResultDeduplication:
         for platform_data in result["platforms"]:
             urls = [r["url"] for r in platform_data["results"]]
             assert len(urls) == len(set(urls)), "Duplicate URLs found in results"
+    
+    @pytest.mark.asyncio
+    async def test_duplicates_across_queries_keep_first_query(self, service):
+        """Test that a URL found by several queries is kept once."""
+        async def fake_search(client, query, platform_id):
+            return [{
+                "title": "Test User",
+                "url": f"https://www.{platform_id}.com/testuser",
+                "snippet": None,
+            }]
+        
+        service._execute_single_search = fake_search
+        
+        platform_id, hits = await service._search_platform(
+            None, "facebook", ["q1", "q2", "q3"]
+        )
+        
+        assert platform_id == "facebook"
+        facebook = hits.to_results()
+        assert len(facebook) == 1
+        assert facebook[0]["query_used"] == "q1"
+    
+    @pytest.mark.asyncio
+    async def test_failed_queries_counted(self, service):
+        """Test that failed searches are counted rather than treated as empty."""
+        async def flaky_search(client, query, platform_id):
+            if query == "q2":
+                return None
+            if query == "q3":
+                raise RuntimeError("boom")
+            return []
+        
+        service._execute_single_search = flaky_search
+        
+        _, hits = await service._search_platform(None, "facebook", ["q1", "q2", "q3"])
+        
+        assert len(hits) == 0
+        assert hits.failed_queries == 2
+    
+    def test_platform_hits_seen_not_constructor_argument(self):
+        """Test that the dedup set tracks constructor URLs and is not an init parameter."""
+        url = "https://www.facebook.com/testuser"
+        hits = PlatformHits(urls=[url], titles=["Test"], snippets=[None], queries=["q1"])
+        
+        assert not hits.add(url, "Test", None, "q2")
+        assert len(hits) == 1
+        with pytest.raises(TypeError):
+            PlatformHits(_seen={url})
+
+
+# =============================================================================
+# STREAMING SCAN TESTS
+# =============================================================================
+
+class TestScanStream:
+    """Tests for the streaming light scan."""
+    
+    @pytest.fixture
+    def service(self):
+        """Create a LightScanService with a stubbed search backend."""
+        service = LightScanService()
+        
+        async def fake_search(client, query, platform_id):
+            return [{
+                "title": "Test User",
+                "url": f"https://www.{platform_id}.com/testuser",
+                "snippet": None,
+            }]
+        
+        service._execute_single_search = fake_search
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_stream_event_order(self, service):
+        """Test that meta comes first, then platforms, then summary."""
+        events = [
+            event["event"]
+            async for event in service.scan_stream("username", "test_user")
+        ]
+        
+        assert events[0] == "meta"
+        assert events[-1] == "summary"
+        assert events[1:-1] == ["platform"] * len(service.PLATFORMS)
+    
+    @pytest.mark.asyncio
+    async def test_stream_close_waits_for_cancelled_searches(self, service):
+        """Test that stopping early leaves no platform search still running."""
+        unwound = []
+        
+        async def slow_search(client, query, platform_id):
+            if platform_id == "facebook":
+                return [{"title": "T", "url": "https://www.facebook.com/testuser", "snippet": None}]
+            try:
+                await asyncio.sleep(60)
+            finally:
+                await asyncio.sleep(0)  # cleanup that needs the loop
+                unwound.append(platform_id)
+            return []
+        
+        service._execute_single_search = slow_search
+        
+        stream = service.scan_stream("username", "test_user")
+        async for event in stream:
+            if event["event"] == "platform":
+                break
+        await stream.aclose()
+        
+        assert sorted(unwound) == sorted(p for p in service.PLATFORMS if p != "facebook")
+    
+    @pytest.mark.asyncio
+    async def test_stream_validates_before_first_event(self, service):
+        """Test that invalid input raises before any event is yielded."""
+        with pytest.raises(ValueError):
+            await service.scan_stream("phone", "0771234567").__anext__()
+    
+    @pytest.mark.asyncio
+    async def test_repeat_scan_served_from_cache(self, service):
+        """Test that an identical scan reuses the cached result."""
+        calls = []
+        original = service._execute_single_search
+        
+        async def counting_search(client, query, platform_id):
+            calls.append(query)
+            return await original(client, query, platform_id)
+        
+        service._execute_single_search = counting_search
+        
+        first = await service.scan("username", "test_user")
+        searches = len(calls)
+        second = await service.scan("username", "  TEST_USER ", "sri lanka")
+        
+        assert len(calls) == searches
+        assert second["platforms"] == first["platforms"]
+        assert second["scan_id"] != first["scan_id"]
+    
+    @pytest.mark.asyncio
+    async def test_failed_search_not_cached(self, service):
+        """Test that a scan with a failed (throttled) query is not cached."""
+        original = service._execute_single_search
+        
+        async def throttled_search(client, query, platform_id):
+            if platform_id == "instagram":
+                return None
+            return await original(client, query, platform_id)
+        
+        service._execute_single_search = throttled_search
+        
+        result = await service.scan("username", "test_user")
+        
+        instagram = next(p for p in result["platforms"] if p["platform"] == "instagram")
+        assert instagram["failed_queries"] == len(instagram["queries_used"])
+        key = ("username", "test_user", service.DEFAULT_LOCATION.lower())
+        assert service._get_cached_scan(key) is None
+    
+    @pytest.mark.asyncio
+    async def test_cache_hit_reports_current_identifier(self, service):
+        """Test that a cached scan echoes the current request's identifier and location."""
+        await service.scan("username", "test_user")
+        second = await service.scan("username", "  TEST_USER ", "sri lanka")
+        
+        assert second["identifier"] == {"type": "username", "value": "TEST_USER"}
+        assert second["location"] == "sri lanka"
+    
+    @pytest.mark.asyncio
+    async def test_expired_cache_entry_rescans(self, service):
+        """Test that results older than the TTL are not reused."""
+        service.SCAN_CACHE_TTL_SECONDS = 0
+        await service.scan("username", "test_user")
+        await asyncio.sleep(0.01)
+        
+        key = ("username", "test_user", service.DEFAULT_LOCATION.lower())
+        assert service._get_cached_scan(key) is None
+    
+    @pytest.mark.asyncio
+    async def test_scan_lock_kept_while_waiters_remain(self, service):
+        """Test that a late scan queues behind a waiter instead of running alongside it."""
+        service.SCAN_CACHE_TTL_SECONDS = -1  # every scan collects
+        original = service._collect_scan
+        in_flight = 0
+        peak = 0
+        
+        async def tracking_collect(*args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            try:
+                return await original(*args)
+            finally:
+                in_flight -= 1
+        
+        service._collect_scan = tracking_collect
+        
+        first = asyncio.create_task(service.scan("username", "test_user"))
+        waiter = asyncio.create_task(service.scan("username", "test_user"))
+        await first
+        late = asyncio.create_task(service.scan("username", "test_user"))
+        await asyncio.gather(waiter, late)
+        
+        assert peak == 1
+        assert service._scan_locks == {}
+    
+    @pytest.mark.asyncio
+    async def test_scan_accumulates_stream(self, service):
+        """Test that scan() assembles platforms in configuration order."""
+        result = await service.scan("username", "test_user")
+        
+        assert [p["platform"] for p in result["platforms"]] == list(service.PLATFORMS)
+        assert result["total_results"] == len(service.PLATFORMS)
+        assert len(result["all_urls"]) == len(service.PLATFORMS)
 
 
 # =============================================================================
@@ -396,3 +396,29 @@ class TestEdgeCases:
         result = lookup.lookup(original)
         
         assert result["original"] == original
+    
+    def test_lookup_validates_once(self, lookup, monkeypatch):
+        """Test that lookup runs validation a single time per number."""
+        calls = []
+        original_validate = lookup._validate
+        
+        def counting_validate(phone):
+            calls.append(phone)
+            return original_validate(phone)
+        
+        monkeypatch.setattr(lookup, "_validate", counting_validate)
+        result = lookup.lookup("0771234567")
+        
+        assert result["carrier"] == "Dialog"
+        assert result["e164_format"] == "+94771234567"
+        assert len(calls) == 1
+    
+    def test_repeat_lookup_cached_and_isolated(self, lookup):
+        """Test that repeat lookups hit the cache and return fresh dicts."""
+        first = lookup.lookup("0771234567")
+        first["carrier"] = "mutated"
+        
+        second = lookup.lookup("0771234567")
+        
+        assert lookup._lookup_cached.cache_info().hits == 1
+        assert second["carrier"] == "Dialog"